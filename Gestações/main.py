@@ -0,0 +1,293 @@
+import pandas as pd
+import numpy as np
+import dash
+from dash import dcc, html
+from dash.dependencies import Input, Output, State
+import os, sys
+PASTA = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(PASTA, '..'))
+from comum.dados import lerTabela
+from comum.montagem import criarApp
+from comum.estilos import folhas
+from comum.graficos import traco, figura
+from comum.idioma import IDIOMAS, IDIOMA_PADRAO, seletorIdioma, registrarIdioma
+
+TEXTOS = {
+	'pt': {
+		'titulo': 'Relação entre imunização de gestantes, pré-natal e mortalidade',
+		'cir': 'CIR',
+		'vac': 'Proporção de gestantes vacinadas',
+		'tri': 'Proporção de gestantes que começaram o pré-natal no 1º trimestre de gestação',
+		'mor': 'Mortalidade neonatal',
+		'porMil': 'por mil',
+		'colorbar': 'Mortalidade neonatal (por mil)',
+	},
+	'en': {
+		'titulo': 'Relationship between vaccinated pregnant women, pre-natal care and neonatal mortality',
+		'cir': 'Health Area',
+		'vac': 'Vaccinated pregnant women',
+		'tri': 'Pregnant women who have started prenatal care in the 1st trimester of pregnancy',
+		'mor': 'Neonatal mortality',
+		'porMil': 'in every 1000',
+		'colorbar': 'Neonatal mortality (per thousand)',
+	},
+}
+
+ANOS = list(range(2000, 2016))
+
+def carregarDados():
+	# Uma única tabela com as três fontes alinhadas pelo código da CIR; colunas (ano, variável)
+	fontes = {
+		'vac': ('PropGestantesVacina.csv', 100),
+		'tri': ('PropGestantePreNatal1trim.csv', 100),
+		'mor': ('RegiaoSaude_TxMortalidadeNeonatal.csv', 1),
+	}
+
+	tabelas = {}
+	for var, (arquivo, escala) in fontes.items():
+		df = lerTabela(os.path.join(PASTA, arquivo), dtype = { 'CIR': str })
+		cir = pd.to_numeric(df['CIR'], errors = 'coerce')
+		if cir.isna().any():
+			print('%s: linhas sem código de CIR ignoradas: %s' % (arquivo, list(df['CIR'][cir.isna()])))
+		df = df[cir.notna()]
+		df.index = cir[cir.notna()].astype(int)
+		tabelas[var] = df[[str(x) for x in ANOS]].rename(columns = int) * escala
+
+	comuns = set.intersection(*[set(df.index) for df in tabelas.values()])
+	for var, df in tabelas.items():
+		sobra = sorted(set(df.index) - comuns)
+		if sobra:
+			print('%s: CIRs sem correspondência nas outras tabelas: %s' % (fontes[var][0], sobra))
+
+	dados = pd.concat(tabelas, axis = 1).loc[sorted(comuns)]
+	dados = dados.swaplevel(axis = 1)[pd.MultiIndex.from_product([ANOS, list(fontes)])]
+	dados.columns.names = ['Ano', 'Variável']
+	return dados
+
+dados = carregarDados()
+
+def calcularRegressoes():
+	# Regressão linear de todos os anos de uma vez; ignora as CIRs zeradas, assim como o gráfico
+	X = dados.xs('vac', axis = 1, level = 'Variável').values
+	Y = dados.xs('tri', axis = 1, level = 'Variável').values
+	C = dados.xs('mor', axis = 1, level = 'Variável').values
+	M = (X != 0) & (Y != 0)
+	X, Y = np.where(M, X, 0), np.where(M, Y, 0)
+
+	rN = M.sum(axis = 0)
+	sX, sY = X.sum(axis = 0), Y.sum(axis = 0)
+	sXY, sX2 = (X * Y).sum(axis = 0), (X ** 2).sum(axis = 0)
+
+	rA = ((rN * sXY) - (sX * sY)) / ((rN * sX2) - (sX ** 2))
+	rB = (sY - (rA * sX)) / rN
+
+	return pd.DataFrame({
+		'a': rA,
+		'b': rB,
+		'mnX': np.where(M, X, 100).min(axis = 0) - 5,
+		'mnMort': C.min(axis = 0),
+		'mxMort': C.max(axis = 0),
+	}, index = ANOS)
+
+regressoes = calcularRegressoes()
+
+# Desenha todas as CIRs num único trace em vez de um trace por CIR
+TRACO_UNICO = True
+# Usa scattergl (WebGL) no modo de trace único, para conjuntos maiores de regiões
+WEBGL = False
+# Envia todos os anos ao navegador uma vez e troca o ano por um callback clientside, sem ida ao servidor
+CLIENTSIDE = True
+
+CIRS = list(dados.index)
+# A escala 'bluered' do plotly, já expandida como o graph_objs fazia ao validar
+BLUERED = [[0.0, 'rgb(0,0,255)'], [1.0, 'rgb(255,0,0)']]
+stylesheets = folhas('base.css')
+app = criarApp(__name__, 'gestacoes', title = TEXTOS[IDIOMA_PADRAO]['titulo'], external_stylesheets = stylesheets)
+
+def tracoUnico(dfAno, MN_MORT, MX_MORT, t):
+	# Todas as CIRs num só trace: cor por ponto, um hovertemplate compartilhado e uma única colorbar
+	dfAno = dfAno[(dfAno['vac'] != 0) & (dfAno['tri'] != 0)]
+	return [
+		traco('scattergl' if WEBGL else 'scatter',
+			x = dfAno['vac'].values,
+			y = dfAno['tri'].values,
+			marker = {
+				'size': 10,
+				'cmax': MX_MORT,
+				'cmin': MN_MORT,
+				'color': dfAno['mor'].values,
+				'colorbar': {
+					'title': { 'text': t['colorbar'] },
+				},
+				'colorscale': BLUERED,
+			},
+			customdata = dfAno.index.values,
+			hovertemplate = t['cir'] + ': %{customdata}<br>' + t['vac'] + ': %{x:.2f}%<br>' + t['tri'] + ': %{y:.2f}%<br>' + \
+							t['mor'] + ': %{marker.color:.2f} ' + t['porMil'] + '<extra></extra>',
+			mode = 'markers',
+			showlegend = False,
+		)
+	]
+
+def updateFig(ano, idioma):
+	if ano is None: return
+	t = TEXTOS[idioma]
+	dfAno = dados[ano]
+	reg = regressoes.loc[ano]
+	MX_MORT, MN_MORT, MN_X = reg['mxMort'], reg['mnMort'], reg['mnX']
+	rA, rB = reg['a'], reg['b']
+
+	rY = lambda x: rA * x + rB
+
+	if TRACO_UNICO or CLIENTSIDE:
+		tracos = tracoUnico(dfAno, MN_MORT, MX_MORT, t)
+	else:
+		tracos = [
+			traco('scatter',
+				x = [vac],
+				y = [tri],
+				marker = {
+					'size': 10,
+					'cmax': MX_MORT,
+					'cmin': MN_MORT,
+					'color': [mor],
+					'colorbar': {
+						'title': { 'text': t['colorbar'] },
+					} if cir == CIRS[0] else {},
+					'colorscale': BLUERED,
+				},
+				text = '%s: %d<br>%s: %.2f%%<br>%s: %.2f%%<br>%s: %.2f %s' % (t['cir'], cir, t['vac'], vac, t['tri'], tri, t['mor'], mor, t['porMil']),
+				hoverinfo = 'text',
+				mode = 'markers',
+				showlegend = False,
+			) for cir, vac, tri, mor in dfAno.itertuples() if vac != 0 and tri != 0
+		]
+
+	layout = {
+		'xaxis': {
+			'title': { 'text': t['vac'] + ' (%)' },
+			'range': [-5, 105],
+		},
+		'yaxis': {
+			'title': { 'text': t['tri'] + ' (%)' },
+			'range': [-5, 105],
+		},
+		'hovermode': 'closest',
+		'height': 800,
+		'width': 1500,
+		'transition': {
+			'duration': 600
+		},
+		'shapes': [{
+			'type': 'line',
+			'x0': MN_X,
+			'y0': rY(MN_X),
+			'x1': 103,
+			'y1': rY(103),
+			'line': {
+				'color': 'LightSeaGreen',
+				'width': 5,
+			}
+		}]
+	}
+
+	return figura(tracos, layout)
+
+# Troca de ano no navegador: recebe todos os anos de uma vez no dcc.Store e só substitui os arrays do trace e a reta
+TROCAR_ANO_JS = """
+function(ano, idioma, dados) {
+	if (ano === null || ano === undefined || !dados) return window.dash_clientside.no_update;
+	var d = dados.anos[ano], x = [], y = [], c = [], cir = [];
+	for (var i = 0; i < dados.cir.length; i++) {
+		if (d.vac[i] === 0 || d.tri[i] === 0) continue;
+		x.push(d.vac[i]); y.push(d.tri[i]); c.push(d.mor[i]); cir.push(dados.cir[i]);
+	}
+	var figura = dados.figuras[idioma];
+	var traco = Object.assign({}, figura.data[0], { x: x, y: y, customdata: cir });
+	traco.marker = Object.assign({}, traco.marker, { color: c, cmin: d.cmin, cmax: d.cmax });
+	var reta = Object.assign({}, figura.layout.shapes[0], { x0: d.reta[0], y0: d.reta[1], x1: d.reta[2], y1: d.reta[3] });
+	return { data: [traco], layout: Object.assign({}, figura.layout, { shapes: [reta] }) };
+}
+"""
+
+def dadosCliente():
+	# Todos os anos em formato compacto: as CIRs uma única vez e, por ano, os valores na mesma ordem
+	anos = {}
+	for ano in ANOS:
+		reg = regressoes.loc[ano]
+		rY = lambda x: round(reg['a'] * x + reg['b'], 2)
+		anos[ano] = {
+			'vac': dados[ano]['vac'].round(2).tolist(),
+			'tri': dados[ano]['tri'].round(2).tolist(),
+			'mor': dados[ano]['mor'].round(2).tolist(),
+			'cmin': reg['mnMort'],
+			'cmax': reg['mxMort'],
+			'reta': [reg['mnX'], rY(reg['mnX']), 103, rY(103)],
+		}
+	# As figuras de cada idioma vão sem os dados, que o navegador preenche a cada troca de ano
+	figuras = {}
+	for idioma in IDIOMAS:
+		fig = updateFig(ANOS[0], idioma)
+		for tr in fig['data']:
+			tr.update(x = [], y = [], customdata = [])
+			tr['marker']['color'] = []
+		figuras[idioma] = fig
+	return {
+		'cir': CIRS,
+		'anos': anos,
+		'figuras': figuras,
+	}
+
+app.layout = html.Div(children = [
+	seletorIdioma(),
+	html.H2(id = 'titulo', children = TEXTOS[IDIOMA_PADRAO]['titulo'], style = { 'text-align': 'center' }),
+	dcc.Store(
+		id = 'dados-anos',
+		data = dadosCliente() if CLIENTSIDE else None,
+	),
+	html.Div(
+		id = 'container',
+		children = [
+			dcc.Graph(
+				id = 'graph',
+			)
+		],
+		style = {
+			'margin-left': '200px',
+		}
+	),
+	html.Div(
+		children = [
+			dcc.Slider(
+				id = 'ano-slider',
+				min = 2000,
+				max = 2015,
+				marks = {
+					i: str(i) for i in range(2000, 2016)
+				},
+				value = 2000,
+				included = False,
+				updatemode = 'drag' if CLIENTSIDE else 'mouseup',
+			),
+		],
+		style = {
+			'margin': '0 auto',
+			'width': '65%',
+		}
+	)
+],
+style = {
+	'font-family': 'sans-serif',
+	'display': 'block',
+	'text-align': 'center',
+},)
+
+registrarIdioma(app, TEXTOS, { 'titulo': ('children', 'titulo') })
+
+if CLIENTSIDE:
+	app.clientside_callback(TROCAR_ANO_JS, Output('graph', 'figure'), [Input('ano-slider', 'value'), Input('idioma', 'value')], [State('dados-anos', 'data')])
+else:
+	app.callback(Output('graph', 'figure'), [Input('ano-slider', 'value'), Input('idioma', 'value')])(updateFig)
+
+if __name__ == '__main__':
+	app.run(debug = True)
@@ -0,0 +1,240 @@
+import pandas as pd
+import numpy as np
+import dash
+from dash import dcc, html, Patch
+from dash.dependencies import Input, Output, State
+import os, sys
+PASTA = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(PASTA, '..'))
+from comum.dados import lerTabela
+from comum.montagem import criarApp
+from comum.estilos import folhas
+from comum.figuras import cachearFiguras
+from comum.graficos import traco, subplots, figura
+from comum.idioma import IDIOMAS, IDIOMA_PADRAO, seletorIdioma, registrarIdioma
+from comum.ufs import REGIOES, NOMES_REGIOES, CORES_REGIOES, regiao
+
+TEXTOS = {
+	'pt': {
+		'titulo': 'Relação entre consultas pré-natal, imunizações e mortalidade neonatal',
+		'subplots': ['Nenhuma consulta', '1 a 6 consultas', '7 ou mais consultas'],
+		'hover': 'UF: %{text}<br>Cobertura de consultas pré-natal: %{x:.2f}%<br>Proporção de imunizações: %{y:.2f}%<br>Mortalidade neonatal: %{customdata} por mil<extra></extra>',
+		'eixoX': 'Cobertura de consultas pré-natal (%)',
+		'eixoY': 'Imunizações (%)',
+		'eixos': [
+			{ 'label': 'Eixo horizontal fixo', 'value': 'x' },
+			{ 'label': 'Eixo vertical fixo', 'value': 'y' },
+		],
+	},
+	'en': {
+		'titulo': 'Relationship between pre-natal appointments, immunizations and neonatal mortality',
+		'subplots': ['No appointments', '1 to 6 appointments', '7 or more appointments'],
+		'hover': 'Federative Unit: %{text}<br>Percentage of appointments: %{x:.2f}%<br>Percentage of immunizations: %{y:.2f}%<br>Neonatal mortality: %{customdata} in every 1000<extra></extra>',
+		'eixoX': 'Coverage of prenatal appointments (%)',
+		'eixoY': 'Immunizations (%)',
+		'eixos': [
+			{ 'label': 'Fixed horizontal axis', 'value': 'x' },
+			{ 'label': 'Fixed vertical axis', 'value': 'y' },
+		],
+	},
+}
+
+# Eixos fixos por padrão; cada sessão pode mudar isso pelos controles abaixo do gráfico
+FIXO = {
+	'x': False,
+	'y': False,
+}
+EIXOS_PADRAO = [k for k in FIXO if FIXO[k]]
+
+dfImun = lerTabela(os.path.join(PASTA, 'imunizacoes.csv'))
+dfMort = lerTabela(os.path.join(PASTA, 'mortalidade.csv'))
+dfCons = lerTabela(os.path.join(PASTA, 'consultas.csv'))
+
+def scale(x):
+	return ((np.log10(2 ** x)) ** 2) + 15
+
+stylesheets = folhas('base.css')
+app = criarApp(__name__, 'imunizacoes', title = TEXTOS[IDIOMA_PADRAO]['titulo'], external_stylesheets = stylesheets)
+dfImun['Região'] = regiao(dfImun['UF'])
+dfMort['Região'] = regiao(dfMort['UF'])
+dfCons['Região'] = regiao(dfCons['UF'])
+
+idsConsultas = [ '_N', '_1_6', '_7_mais' ]
+
+
+ANOS = list(range(2000, 2017))
+
+def agruparDados():
+	# Arrays prontos por (região, ano, tipo de consulta): x, y, tamanho dos marcadores, siglas e mortalidade
+	grupos = {}
+	for i in REGIOES:
+		cons = dfCons[dfCons['Região'] == i]
+		imun = dfImun[dfImun['Região'] == i]
+		mort = dfMort[dfMort['Região'] == i]
+		siglas = imun['Sigla'].values
+		for ano in ANOS:
+			val_y = imun[str(ano)].values
+			val_m = mort[str(ano)].values
+			for j in range(len(idsConsultas)):
+				val_x = cons[str(ano) + idsConsultas[j]].values
+				grupos[(i, ano, j)] = {
+					'x': val_x,
+					'y': val_y,
+					'size': np.round(scale(val_m), 1),
+					'text': siglas,
+					'mort': val_m,
+				}
+	return grupos
+
+grupos = agruparDados()
+
+def montarFigura(ano, eixos, idioma):
+	# Esqueleto completo da figura; as trocas de ano só substituem os arrays dos traces
+	t = TEXTOS[idioma]
+	layout = subplots(3, t['subplots'], 0.025)
+
+	data = []
+	for j in range(len(idsConsultas)):
+		for i in REGIOES:
+			g = grupos[(i, ano, j)]
+			data.append(traco('scatter', j + 1,
+				x = g['x'],
+				y = g['y'],
+				mode = 'markers+text',
+				textposition = 'middle right',
+				text = g['text'],
+				customdata = g['mort'],
+				hovertemplate = t['hover'],
+				marker = {
+					'size': g['size'],
+					'color': CORES_REGIOES[i],
+				},
+				name = NOMES_REGIOES[idioma][i],
+				showlegend = (j == 0),
+			))
+
+	layout.update(
+		height = 700,
+		hovermode = 'closest',
+	)
+	layout['yaxis']['title'] = { 'text': t['eixoY'] }
+	layout['xaxis2']['title'] = { 'text': t['eixoX'] }
+
+	for i in range(3):
+		sufixo = str(i + 1) if i else ''
+		if 'x' in eixos: layout['xaxis' + sufixo]['range'] = [-9, 109]
+		if 'y' in eixos: layout['yaxis' + sufixo]['range'] = [-9, 119]
+
+	return figura(data, layout, tema = True)
+
+figuraBase = montarFigura(ANOS[0], EIXOS_PADRAO, IDIOMA_PADRAO)
+
+app.layout = html.Div(children = [
+		seletorIdioma(),
+		html.H2(id = 'titulo', children = TEXTOS[IDIOMA_PADRAO]['titulo'], style = { 'text-align': 'center' }),
+		html.Div(
+			id = 'graph-wrapper',
+			children = [
+				dcc.Graph(
+					id = 'graph',
+					figure = figuraBase,
+				),
+			],
+			style = {
+				'width': '80%',
+				'margin': '0 auto',
+			},
+		),
+		html.Div(
+			id = 'slider-wrapper',
+			children = [
+				dcc.Slider(
+					id = 'slider-ano',
+					min = 2000,
+					max = 2016,
+					step = 1,
+					value = 2000,
+					included = False,
+					marks = { i: str(i) for i in range(2000, 2017) },
+				)
+			],
+			style = {
+				'width': '50%',
+				'margin': '0 auto',
+			}
+		),
+		html.Div(
+			id = 'eixos-wrapper',
+			children = [
+				dcc.Checklist(
+					id = 'eixos-fixos',
+					options = TEXTOS[IDIOMA_PADRAO]['eixos'],
+					value = EIXOS_PADRAO,
+					inline = True,
+					persistence = True,
+					persistence_type = 'session',
+				),
+			],
+			style = {
+				'margin-top': '30px',
+			}
+		),
+		dcc.Store(id = 'iniciado', data = False),
+	],
+	style = {
+		'font-family': 'sans-serif',
+		'display': 'block',
+		'text-align': 'center',
+	},
+)
+
+registrarIdioma(app, TEXTOS, {
+	'titulo': ('children', 'titulo'),
+	'eixos-fixos': ('options', 'eixos'),
+})
+
+@app.callback([Output('graph', 'figure'), Output('iniciado', 'data')], [
+	Input('slider-ano', 'value'),
+	Input('eixos-fixos', 'value'),
+	Input('idioma', 'value'),
+], [State('iniciado', 'data')])
+def updateGraph(ano, eixos, idioma, iniciado):
+	# Depende só das entradas: os eixos fixos e o primeiro desenho ficam no navegador de cada sessão
+	if ano is None: return dash.no_update, iniciado
+
+	# Trocar o idioma muda títulos, legendas e hover: aí vale mandar a figura inteira
+	if dash.ctx.triggered_id == 'idioma':
+		return montarFigura(ano, eixos, idioma), True
+
+	fig = Patch()
+	k = 0
+	for j in range(len(idsConsultas)):
+		for i in REGIOES:
+			g = grupos[(i, ano, j)]
+			fig['data'][k]['x'] = g['x']
+			fig['data'][k]['y'] = g['y']
+			fig['data'][k]['customdata'] = g['mort']
+			fig['data'][k]['marker']['size'] = g['size']
+			k += 1
+
+	for i in range(3):
+		sufixo = str(i + 1) if i else ''
+		fig['layout']['xaxis' + sufixo]['range'] = [-9, 109] if 'x' in eixos else None
+		fig['layout']['xaxis' + sufixo]['autorange'] = 'x' not in eixos
+		fig['layout']['yaxis' + sufixo]['range'] = [-9, 119] if 'y' in eixos else None
+		fig['layout']['yaxis' + sufixo]['autorange'] = 'y' not in eixos
+
+	fig['layout']['transition'] = { 'duration': 500 if 'x' in eixos and 'y' in eixos and iniciado else 0 }
+
+	return fig, True
+
+# A resposta muda conforme o idioma disparou ou não (figura inteira ou Patch), e a ordem dos eixos marcados depende dos cliques
+cachearFiguras(app, '..graph.figure...iniciado.data..', {
+	'slider-ano': ANOS,
+	'eixos-fixos': [[], ['x'], ['y'], ['x', 'y'], ['y', 'x']],
+	'idioma': IDIOMAS,
+	'iniciado': [False, True],
+}, disparos = ['idioma.value'])
+
+if __name__ == '__main__':
+	app.run(debug = True)
@@ -0,0 +1,247 @@
+import pandas as pd
+import numpy as np
+import dash
+from dash import dcc, html
+from dash.dependencies import Input, Output, State
+import os, sys
+PASTA = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(PASTA, '..'))
+from comum.formatacao import formatarMoeda, formatarNumeros
+from comum.dados import lerTabela
+from comum.montagem import criarApp
+from comum.estilos import folhas
+from comum.figuras import cachearFiguras
+from comum.graficos import traco, figura
+from comum.idioma import IDIOMAS, IDIOMA_PADRAO, seletorIdioma, registrarIdioma
+from comum.ufs import UFS
+
+TEXTOS = {
+	'pt': {
+		'titulo': 'Relações entre mortalidade neonatal, PIB e IDH',
+		'seletor': 'Selecione uma UF',
+		'mortes': 'Mortes',
+		'uf': 'UF',
+		'totalMortes': 'Total de mortes',
+		'pib': 'PIB',
+		'idh': 'IDH',
+		'mortalidade': 'Mortalidade',
+		'formatoMortalidade': '%.2f por mil',
+		'tamanhoAnotacao': 20,
+		'legenda': 'h',
+	},
+	'en': {
+		'titulo': 'Relations between neonatal mortality, GDP and HDI',
+		'seletor': 'Federative Unit selector',
+		'mortes': 'Deaths',
+		'uf': 'Federative Unit',
+		'totalMortes': 'Total number of deaths',
+		'pib': 'GDP',
+		'idh': 'HDI',
+		'mortalidade': 'Neonatal mortality',
+		'formatoMortalidade': '%.2f‰',
+		'tamanhoAnotacao': 18,
+		'legenda': 'v',
+	},
+}
+
+# Uma só tabela de causas: a em inglês tem as mesmas linhas (UF, Ano e Total), só os nomes das causas mudam
+doencas = lerTabela(os.path.join(PASTA, 'doencas_pt.csv'), categorias = ['UF'])
+idhs = lerTabela(os.path.join(PASTA, 'idh.csv'))
+pibs = lerTabela(os.path.join(PASTA, 'pib.csv'))
+mort = lerTabela(os.path.join(PASTA, 'mortes.csv'))
+
+# Cada causa vira um código; os nomes ficam num vetor por idioma, na ordem dos códigos
+codigos, nomes = pd.factorize(doencas['CID10'])
+
+# A tabela em inglês só serve para os nomes, então ela tem que ter as mesmas linhas, e cada causa em português
+# tem que corresponder a uma só em inglês (e vice-versa): com os mesmos códigos, os nomes não se trocam
+ingles = lerTabela(os.path.join(PASTA, 'doencas_en.csv'), categorias = ['UF'])
+diferentes = [c for c in ['UF', 'Ano', 'Total'] if len(ingles) != len(doencas) or
+			  not (ingles[c].to_numpy(dtype = object) == doencas[c].to_numpy(dtype = object)).all()]
+if diferentes:
+	raise ValueError('doencas_en.csv não tem as mesmas linhas de doencas_pt.csv (colunas %s)' % ', '.join(diferentes))
+codigosEn, nomesEn = pd.factorize(ingles['CID10'])
+if not (codigosEn == codigos).all():
+	raise ValueError('as causas de doencas_en.csv não correspondem uma a uma às de doencas_pt.csv')
+
+CAUSAS = {
+	'pt': np.asarray(nomes, dtype = object),
+	'en': np.asarray(nomesEn, dtype = object),
+}
+del ingles, codigosEn, nomesEn
+
+ANOS = list(range(2010, 2016))
+COLUNAS = [str(x) for x in ANOS]
+
+filtro = doencas['Ano'].isin(ANOS).values
+doencas = doencas[filtro].assign(Causa = codigos[filtro])
+causas = doencas['Causa'].values
+totais = doencas['Total'].values
+perc = formatarNumeros(totais * 100 / doencas.groupby(['UF', 'Ano'], observed = True)['Total'].transform('sum').values, '%.1f%%')
+
+# Tudo o que o gráfico usa por (UF, ano), calculado uma vez: códigos das causas e totais, e por idioma hover e anotação
+grupos = doencas.groupby(['UF', 'Ano'], sort = False, observed = True).indices
+indice = {
+	chave: { 'causas': causas[linhas], 'values': totais[linhas], 'hovertext': {}, 'anotacao': {} }
+	for chave, linhas in grupos.items()
+}
+
+def indexarTextos(idioma):
+	t = TEXTOS[idioma]
+
+	# Textos de PIB, IDH e mortalidade de todas as UFs e anos, formatados de uma vez
+	pibsTxt = pd.DataFrame(formatarMoeda(pibs[COLUNAS].values, idioma), index = pibs['Nome'], columns = COLUNAS)
+	idhsTxt = pd.DataFrame(formatarNumeros(idhs[COLUNAS].values, '%.3f'), index = idhs['Nome'], columns = COLUNAS)
+	mortTxt = pd.DataFrame(formatarNumeros(mort[COLUNAS].values, t['formatoMortalidade']), index = mort['UF'], columns = COLUNAS)
+
+	hover = CAUSAS[idioma][causas] + ('<br>' + t['mortes'] + ': ') + totais.astype(str).astype(object) + \
+			' (' + perc.astype(object) + ')'
+	for (uf, ano), linhas in grupos.items():
+		d = indice[(uf, ano)]
+		d['hovertext'][idioma] = hover[linhas]
+		d['anotacao'][idioma] = t['uf'] + ': ' + uf + '<br>' + t['totalMortes'] + ': ' + str(d['values'].sum()) + '<br>' + \
+								t['pib'] + ': ' + pibsTxt.at[uf, str(ano)] + '<br>' + \
+								t['idh'] + ': ' + idhsTxt.at[uf, str(ano)] + '<br>' + \
+								t['mortalidade'] + ': ' + mortTxt.at[uf, str(ano)]
+
+for idioma in IDIOMAS:
+	indexarTextos(idioma)
+
+stylesheets = folhas('base.css')
+app = criarApp(__name__, 'mortalidade', title = TEXTOS[IDIOMA_PADRAO]['titulo'], external_stylesheets = stylesheets)
+app.layout = html.Div(children = [
+	seletorIdioma(),
+	html.H2(
+		id = 'titulo',
+		children = TEXTOS[IDIOMA_PADRAO]['titulo'],
+	),
+	html.Div(
+		id = 'dropdown-wrapper',
+		children = [
+			html.Label(id = 'seletor', children = TEXTOS[IDIOMA_PADRAO]['seletor']),
+			html.Br(),
+			html.Div(
+				children = [
+					dcc.Dropdown(
+						id = 'dropdown',
+						value = 'RO',
+						clearable = False,
+						placeholder = 'UF',
+						style = {
+							'width': '100px',
+							'text-align': 'center',
+						},
+						options = [
+							{ 'label': uf, 'value': uf }
+							for uf in UFS['Sigla']
+						]
+					)
+				],
+				style = {
+					'display': 'inline-block',
+					'padding': '0 10px',
+				}
+			)
+		],
+	),
+	html.Br(),
+	html.Div(
+		id = 'slider-wrapper',
+		children = [
+			dcc.Slider(
+				id = 'slider-year',
+				min = 2010,
+				max = 2015,
+				step = 1,
+				value = 2010,
+				marks = {
+					year: {
+						'label': str(year),
+						'style': { 'color': '#060013' },
+					}
+					for year in range(2010, 2016)
+				},
+				included = False,
+			),
+		],
+		style = {
+			'width': '40%',
+			'margin': '0 auto',
+		},
+	),
+	html.Br(), html.Br(),
+	html.Div(
+		id = 'graph-wrapper',
+		children = [
+			dcc.Graph(
+				id = 'graph'
+			),
+		],
+		style = {
+			'width': '80%',
+			'margin': '0 auto',
+			'max-width': '80%',
+			'min-width': '80%',
+		},
+	)],
+	style = {
+		'font-family': 'sans-serif',
+		'display': 'block',
+		'text-align': 'center',
+	},
+)
+
+registrarIdioma(app, TEXTOS, {
+	'titulo': ('children', 'titulo'),
+	'seletor': ('children', 'seletor'),
+})
+
+@app.callback(Output('graph', 'figure'), [Input('dropdown', 'value'), Input('slider-year', 'value'), Input('idioma', 'value')])
+def updateGraph(drop, year, idioma):
+	if None in [drop, year]: pass
+
+	t = TEXTOS[idioma]
+	d = indice[(drop, year)]
+	data = [
+		traco('pie',
+			labels = CAUSAS[idioma][d['causas']],
+			values = d['values'],
+			hole = 0.6,
+			hoverinfo = 'text',
+			hovertext = d['hovertext'][idioma],
+		)
+	]
+	layout = {
+		'hovermode': 'closest',
+		'height': 700,
+		'plot_bgcolor': 'white',
+		'xaxis': {
+			'showticklabels': False,
+			'showgrid': False,
+			'zeroline': False,
+		},
+		'yaxis': {
+			'showticklabels': False,
+			'showgrid': False,
+			'zeroline': False,
+		},
+		'annotations': [{
+			'text': d['anotacao'][idioma],
+			'x': 0.5,
+			'y': 0.5,
+			'font': { 'size': t['tamanhoAnotacao'] },
+			'showarrow': False,
+		}],
+		'legend': { 'orientation': t['legenda'] },
+	}
+
+	return figura(data, layout)
+
+cachearFiguras(app, 'graph.figure', {
+	'dropdown': list(UFS['Sigla']),
+	'slider-year': ANOS,
+	'idioma': IDIOMAS,
+})
+
+if __name__ == '__main__':
+	app.run(debug = True)
@@ -0,0 +1,256 @@
+import time
+import pandas as pd
+import numpy as np
+import dash
+from dash import dcc, html
+from dash.dependencies import Input, Output, State
+import os, sys
+PASTA = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(PASTA, '..'))
+from comum.formatacao import formatarNumeros
+from comum.dados import lerTabela
+from comum.montagem import criarApp
+from comum.estilos import folhas
+from comum.graficos import traco, figura
+from comum.idioma import IDIOMAS, IDIOMA_PADRAO, seletorIdioma, registrarIdioma
+from comum.ufs import NOMES_REGIOES, regiao, sigla
+
+# As colunas internas ficam em português; só o que aparece na tela é traduzido
+TEXTOS = {
+    'pt': {
+        'titulo': 'Relação entre tipos de parto e mortalidade neonatal',
+        'ano': 'Ano:',
+        'transicao': 'Delay de transição (ms):',
+        'reproduzir': 'Reproduzir',
+        'pausar': 'Pausar',
+        'uf': 'UF',
+        'cesarios': 'Partos cesários',
+        'hospitalares': 'Partos hospitalares',
+        'mortalidade': 'Mortalidade neonatal',
+        'porMil': 'por mil',
+    },
+    'en': {
+        'titulo': 'Relationship between delivery type and neonatal mortality',
+        'ano': 'Year:',
+        'transicao': 'Transition delay (ms):',
+        'reproduzir': 'Play',
+        'pausar': 'Pause',
+        'uf': 'Federative Unit',
+        'cesarios': 'Caesarean births',
+        'hospitalares': 'Hospital births',
+        'mortalidade': 'Neonatal mortality',
+        'porMil': 'in every 1000',
+    },
+}
+
+stylesheets = folhas('base.css')
+
+app = criarApp(__name__, 'partos', title=TEXTOS[IDIOMA_PADRAO]['titulo'], external_stylesheets=stylesheets)
+
+def scale(x):
+    return ((np.log10(2 ** x)) ** 2) + 15
+
+dfCesarios = lerTabela(os.path.join(PASTA, 'dados.xlsx'), 0, indice='UF')
+dfHospitalares = lerTabela(os.path.join(PASTA, 'dados.xlsx'), 1, indice='Código UF')
+dfMortalidade = lerTabela(os.path.join(PASTA, 'dados.xlsx'), 2, indice='UF')
+
+dfHospitalares.index.names = ['UF']
+
+rnDict = {
+    0: 'Partos cesários (%)',
+    1: 'Partos hospitalares (%)',
+    2: 'Mortalidade neonatal'
+}
+
+# Tabela longa com uma linha por (ano, UF), montada das três planilhas de uma vez
+df = pd.concat([
+    dfCesarios.T.stack(),
+    dfHospitalares.T.stack(),
+    dfMortalidade.T.stack(),
+], axis = 1, keys = list(rnDict.values()))
+df.index.names = ['Ano', 'UF']
+df = df.reset_index(level = 'Ano')
+df['Ano'] = df['Ano'].astype(int)
+
+df['Região'] = regiao(df.index)
+df['Sigla'] = sigla(df.index)
+df['Partos cesários (%)'] *= 100
+df['Partos hospitalares (%)'] *= 100
+# Arredonda pelo texto com uma casa, como antes, para manter os mesmos valores nos empates
+df['Mortalidade neonatal'] = formatarNumeros(df['Mortalidade neonatal'].values, '%.1f').astype(float)
+df['Raio'] = scale(df['Mortalidade neonatal'])
+
+REGIOES = list(df['Região'].unique())
+
+def agruparDados():
+    # Arrays prontos por (região, ano); o hover é montado pelo hovertemplate de cada idioma
+    grupos = {}
+    for (regiao, ano), linhas in df.groupby(['Região', 'Ano'], sort = False).indices.items():
+        grupo = df.iloc[linhas]
+        grupos[(regiao, ano)] = {
+            'x': grupo['Partos cesários (%)'].values,
+            'y': grupo['Partos hospitalares (%)'].values,
+            'text': grupo['Sigla'].values,
+            'size': grupo['Raio'].values,
+            'mort': grupo['Mortalidade neonatal'].values,
+        }
+    return grupos
+
+grupos = agruparDados()
+
+ANOS = sorted(df['Ano'].unique())
+# Pausa entre um ano e o seguinte durante a reprodução, além da transição
+INTERVALO = 400
+
+def tracos(ano):
+    # Só o que muda de um ano para outro, com duas casas decimais, que é o que o hover mostra
+    return [
+        traco('scatter',
+            x = np.round(grupos[(i, ano)]['x'], 2),
+            y = np.round(grupos[(i, ano)]['y'], 2),
+            text = grupos[(i, ano)]['text'],
+            customdata = grupos[(i, ano)]['mort'],
+            marker = {
+                'size': np.round(grupos[(i, ano)]['size'], 2),
+            },
+        ) for i in REGIOES
+    ]
+
+# Os frames não dependem do idioma, então vão uma única vez para o navegador
+frames = [{ 'name': str(ano), 'data': tracos(ano) } for ano in ANOS]
+
+def montarFigura(idioma, transic = 500):
+    # Figura de cada idioma, sem os frames; reproduzir, pausar e trocar de ano acontecem só no navegador
+    t = TEXTOS[idioma]
+    animacao = {
+        'frame': { 'duration': transic + INTERVALO, 'redraw': False },
+        'transition': { 'duration': transic },
+        'mode': 'immediate',
+    }
+
+    hover = t['uf'] + ': %{text}<br>' + \
+            t['cesarios'] + ': %{x:.2f}%<br>' + \
+            t['hospitalares'] + ': %{y:.2f}%<br>' + \
+            t['mortalidade'] + ': %{customdata:.2f}% ' + t['porMil'] + '<extra></extra>'
+    data = [
+        dict(tr, mode = 'markers+text', textposition = 'middle right', hovertemplate = hover, name = NOMES_REGIOES[idioma][i])
+        for tr, i in zip(tracos(ANOS[0]), REGIOES)
+    ]
+
+    layout = {
+        'xaxis': {
+            'title': { 'text': t['cesarios'] + ' (%)' },
+            #'range': [0, 100],
+        },
+        'yaxis': {
+            'title': { 'text': t['hospitalares'] + ' (%)' },
+            #'range': [80, 104],
+        },
+        'height': 800,
+        'hovermode': 'closest',
+        'transition': {
+            'duration': transic,
+        },
+        'updatemenus': [{
+            'type': 'buttons',
+            'direction': 'left',
+            'showactive': False,
+            'x': 0,
+            'y': 0,
+            'xanchor': 'right',
+            'yanchor': 'top',
+            'pad': { 't': 60, 'r': 10 },
+            'buttons': [
+                { 'label': t['reproduzir'], 'method': 'animate', 'args': [None, dict(animacao, fromcurrent = True)] },
+                { 'label': t['pausar'], 'method': 'animate', 'args': [[None], { 'frame': { 'duration': 0, 'redraw': False }, 'transition': { 'duration': 0 }, 'mode': 'immediate' }] },
+            ],
+        }],
+        'sliders': [{
+            'active': 0,
+            'x': 0,
+            'y': 0,
+            'yanchor': 'top',
+            'pad': { 't': 50 },
+            'currentvalue': { 'prefix': t['ano'] + ' ' },
+            'steps': [
+                { 'label': str(ano), 'method': 'animate', 'args': [[str(ano)], animacao] }
+                for ano in ANOS
+            ],
+        }],
+    }
+
+    return figura(data, layout)
+
+# Troca de idioma e de duração no navegador: mantém o ano atual do slider da figura e só reescreve as durações
+TROCAR_FIGURA_JS = """
+function(transicao, idioma, dados) {
+    if (!dados) return window.dash_clientside.no_update;
+    var figura = JSON.parse(JSON.stringify(dados.figuras[idioma]));
+    figura.frames = dados.frames;
+    var gd = document.querySelector('#relacao-partos .js-plotly-plot');
+    var ativo = (gd && gd.layout && gd.layout.sliders && gd.layout.sliders[0].active) || 0;
+
+    var quadro = figura.frames[ativo];
+    figura.data.forEach(function(traco, i) {
+        var q = quadro.data[i];
+        traco.x = q.x; traco.y = q.y; traco.text = q.text; traco.customdata = q.customdata;
+        traco.marker = Object.assign({}, traco.marker, q.marker);
+    });
+
+    var animacao = { frame: { duration: transicao + %d, redraw: false }, transition: { duration: transicao }, mode: 'immediate' };
+    figura.layout.transition = { duration: transicao };
+    figura.layout.updatemenus[0].buttons[0].args[1] = Object.assign({ fromcurrent: true }, animacao);
+    figura.layout.sliders[0].active = ativo;
+    figura.layout.sliders[0].steps.forEach(function(passo) { passo.args[1] = animacao; });
+    return figura;
+}
+""" % INTERVALO
+
+app.layout = html.Div(children = [
+    seletorIdioma(),
+    html.H2(id='titulo', children = TEXTOS[IDIOMA_PADRAO]['titulo']),
+    dcc.Store(
+        id='figuras',
+        data = {
+            'frames': frames,
+            'figuras': { idioma: montarFigura(idioma) for idioma in IDIOMAS },
+        },
+    ),
+    dcc.Graph(
+        id='relacao-partos',
+        figure = {
+            'data': []
+        }
+    ),
+    html.Div(id='grafico-slider', style={'width': '60vw', 'margin': '0 auto', 'fontFamily': 'sans-serif', 'textAlign': 'center'}, children=[
+        html.Label(TEXTOS[IDIOMA_PADRAO]['transicao'], id='rotulo-transicao'),
+        dcc.Slider(
+            id='transicao-slider',
+            min=0,
+            max=1000,
+            marks = {
+                i: str(i) + ' ms' for i in range(0, 1001, 100)
+            },
+            value = 500,
+            included = False,
+        ),
+    ]),
+],
+style = {
+    'font-family': 'sans-serif',
+    'display': 'block',
+    'text-align': 'center',
+})
+
+N_CLICKS = 0
+
+registrarIdioma(app, TEXTOS, {
+    'titulo': ('children', 'titulo'),
+    'rotulo-transicao': ('children', 'transicao'),
+})
+
+app.clientside_callback(TROCAR_FIGURA_JS, Output('relacao-partos', 'figure'),
+                [Input('transicao-slider', 'value'), Input('idioma', 'value')], [State('figuras', 'data')])
+
+if __name__ == '__main__':
+    app.run(debug=True)
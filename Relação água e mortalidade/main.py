@@ -0,0 +1,179 @@
+import pandas as pd
+import numpy as np
+import dash
+from dash import dcc, html
+from dash.dependencies import Input, Output, State
+import os, sys
+PASTA = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(PASTA, '..'))
+from comum.dados import lerTabela
+from comum.montagem import criarApp
+from comum.estilos import folhas
+from comum.figuras import cachearFiguras
+from comum.graficos import traco, subplots, figura
+from comum.idioma import IDIOMAS, IDIOMA_PADRAO, seletorIdioma, registrarIdioma
+from comum.ufs import UFS, REGIOES, NOMES_REGIOES, CORES_REGIOES, regiao, sigla
+
+stylesheets = folhas('base.css', 'agua.css')
+
+# As regiões ficam em português nos dados; só o que aparece na tela é traduzido
+TEXTOS = {
+	'pt': {
+		'titulo': 'Relação entre abastecimento d\'água e mortalidade neonatal',
+		'seletor': ['Selecione uma UF para focar:'],
+		'estados': [{ 'label': 'Todas', 'value': '*' }] + [ { 'label': uf, 'value': i } for i, uf in UFS['Sigla'].items() ],
+		'uf': 'UF',
+		'mortalidade': 'Mortalidade neonatal',
+		'porMil': 'por mil',
+		'abastecimento': 'Abastecimento d\'água',
+	},
+	'en': {
+		'titulo': 'Relationship between water supply and neonatal mortality',
+		'seletor': ['Select a Federative Unit to highlight:'],
+		'estados': [{ 'label': 'All federative units', 'value': '*' }] + [ { 'label': uf, 'value': i } for i, uf in UFS['Sigla'].items() ],
+		'uf': 'Federative Unit',
+		'mortalidade': 'Neonatal mortality',
+		'porMil': 'in every 1000',
+		'abastecimento': 'Water supply',
+	},
+}
+
+# Uma linha por (ano, UF), com as duas tabelas derretidas e juntadas
+dfMortalidade = lerTabela(os.path.join(PASTA, 'mortalidade.csv')).melt(id_vars = 'UF', var_name = 'Ano', value_name = 'Mortalidade')
+dfAgua = lerTabela(os.path.join(PASTA, 'agua.csv')).melt(id_vars = 'UF', var_name = 'Ano', value_name = 'Abastecimento')
+df = dfMortalidade.merge(dfAgua, on = ['UF', 'Ano']).rename(columns = { 'UF': 'Cod' })
+
+df['Ano'] = df['Ano'].astype(int)
+df['UF'] = sigla(df['Cod'])
+df['Região'] = regiao(df['Cod'])
+
+ACCUM_STEP = 0.15
+ACCUM_SKIP = 0.5
+
+def posicaoX(df):
+	# Posição horizontal de cada bolha em torno do seu ano: um passo por UF, na ordem dos códigos,
+	# mais um espaço a cada troca de região (o primeiro dígito do código), com o conjunto centrado no ano.
+	# Vale para qualquer número de anos e UFs.
+	anos = df.groupby('Ano')
+	ordem = anos['Cod'].rank(method = 'dense') - 1
+	grupo = (df['Cod'] // 10).groupby(df['Ano']).rank(method = 'dense') - 1
+	inicio = -((anos['Cod'].transform('count') * ACCUM_STEP) + (grupo.groupby(df['Ano']).transform('max') * ACCUM_SKIP)) / 2
+	return df['Ano'] + inicio + (ordem * ACCUM_STEP) + (grupo * ACCUM_SKIP)
+
+df['PosX'] = posicaoX(df)
+df['Raio'] = 2 * df['Mortalidade'] / (df['Abastecimento'] / 100)
+df['Cor'] = df['Região'].map(CORES_REGIOES)
+
+ANOS = sorted(df['Ano'].unique().tolist())
+
+del dfMortalidade, dfAgua
+
+app = criarApp(__name__, 'agua', title=TEXTOS[IDIOMA_PADRAO]['titulo'], external_stylesheets=stylesheets)
+
+app.layout = html.Div(children = [
+    seletorIdioma(),
+    html.H2(id = 'titulo', children = TEXTOS[IDIOMA_PADRAO]['titulo'], style = { 'text-align': 'center' }),
+	html.Div(children = [
+			html.H3(id = 'seletor', children=TEXTOS[IDIOMA_PADRAO]['seletor'], style = { 'marginBottom': '0px' }),
+			dcc.Dropdown(
+		    	id = 'dd-estado',
+		    	options = TEXTOS[IDIOMA_PADRAO]['estados'],
+		    	value = '*',
+                style = {
+                    'width': '20vw',
+                    'margin': '0 auto',
+                },
+                searchable = False,
+		    ),
+	    ],
+	    style = {
+	    	'margin': '0 auto',
+	    	'width': '60%',
+	    	'textAlign': 'center',
+	    	'fontFamily': 'sans-serif',
+	    }
+    ),
+    dcc.Graph(
+        id = 'relacao-agua',
+        figure = { },
+    )
+],
+style = {
+    'font-family': 'sans-serif',
+    'display': 'block',
+    'text-align': 'center',
+})
+
+registrarIdioma(app, TEXTOS, {
+	'titulo': ('children', 'titulo'),
+	'seletor': ('children', 'seletor'),
+	'dd-estado': ('options', 'estados'),
+})
+
+@app.callback(
+    Output('relacao-agua', 'figure'),
+    [Input('dd-estado', 'value'), Input('idioma', 'value')])
+def update_output(estado, idioma):
+    if estado is None: return
+
+    t = TEXTOS[idioma]
+
+    layout = subplots(len(ANOS), [str(ano) for ano in ANOS], 0.025)
+    data = []
+
+    # Um trace por ano; a UF em foco fica com opacidade cheia e as demais esmaecidas, ponto a ponto
+    for I, (ano, d) in enumerate(df.groupby('Ano')):
+        layout['xaxis' + (str(I + 1) if I else '')]['tickvals'] = [ano]
+        foco = (estado == '*') | (d['Cod'].values == estado)
+        data.append(traco('scatter', I + 1,
+            x = d['PosX'].values,
+            y = d['Abastecimento'].values,
+            mode = 'markers+text',
+            textposition = 'top center',
+            text = d['UF'].values,
+            textfont = {
+                'color': np.where(foco, '#444', 'rgba(68, 68, 68, 0.25)'),
+            },
+            marker = {
+                'size': d['Raio'].values,
+                'line': { 'color': 'black', 'width': 1 },
+                'color': d['Cor'].values,
+                'opacity': np.where(foco, 1, 0.25),
+            },
+            customdata = d['Mortalidade'].values,
+            hovertemplate = t['uf'] + ': %{text}<br>' + \
+                            t['mortalidade'] + ': %{customdata:.2f} ' + t['porMil'] + '<br>' + \
+                            t['abastecimento'] + ': %{y:d}%<extra></extra>',
+            showlegend = False,
+        ))
+
+    # A legenda vem de traces vazios, um por região, só com a cor
+    for reg in REGIOES:
+        data.append(traco('scatter', 1,
+            x = [None],
+            y = [None],
+            mode = 'markers',
+            marker = {
+                'size': 10,
+                'line': { 'color': 'black', 'width': 1 },
+                'color': CORES_REGIOES[reg],
+            },
+            name = NOMES_REGIOES[idioma][reg],
+            legendgroup = 'legendgroup-1',
+        ))
+
+    layout.update(height = 800, hovermode = 'closest', showlegend = True)
+    layout['yaxis'].update(
+        title = { 'text': t['abastecimento'] + ' (%)' },
+        range = [70, 104],
+    )
+
+    return figura(data, layout, tema = True)
+
+cachearFiguras(app, 'relacao-agua.figure', {
+    'dd-estado': ['*'] + [int(i) for i in UFS.index],
+    'idioma': IDIOMAS,
+})
+
+if __name__ == '__main__':
+    app.run(debug=True)
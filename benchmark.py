@@ -0,0 +1,170 @@
+# Benchmark dos callbacks de todas as visualizações, sobre todo o domínio das entradas.
+#
+#   python benchmark.py --saida bench.json                  # mede e grava os resultados
+#   python benchmark.py --saida novo.json --base bench.json # mede e compara com uma medição anterior
+#
+# Os callbacks de servidor são chamados pelo /_dash-update-component do servidor único (servidor.py),
+# como o navegador faria, então o tempo inclui a serialização do Dash e o tamanho é o da resposta.
+# As figuras que hoje são trocadas no navegador (Gestações e partos) têm a função de montagem medida diretamente.
+# Com o cache de figuras (comum/figuras.py) as respostas já vêm prontas; COTB_FIGURAS=0 mede a montagem.
+# O estado do cache fica gravado nos resultados, e medições com estados diferentes não são comparadas.
+import argparse, json, os, sys, time, tracemalloc, platform, datetime
+import numpy as np
+import pandas as pd
+import plotly
+import dash
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, RAIZ)
+import servidor
+from comum import figuras, montagem
+from comum.figuras import corpoCallback
+from comum.serializacao import serializar
+from comum.idioma import IDIOMAS
+from comum.ufs import UFS
+
+APPS = dict(montagem.APPS)
+cliente = servidor.server.test_client()
+
+def viaServidor(rota, chave, valores, disparo):
+	corpo = corpoCallback(APPS[rota], chave, valores, disparo)
+	def chamar():
+		r = cliente.post('/%s/_dash-update-component' % rota, json = corpo)
+		if r.status_code != 200:
+			raise RuntimeError('%s %s: HTTP %d' % (rota, valores, r.status_code))
+		return len(r.data)
+	return chamar
+
+def direto(funcao, *args):
+	def chamar():
+		return len(serializar(funcao(*args)).encode('utf-8'))
+	return chamar
+
+def grupos():
+	# Nome do grupo -> lista de casos; cada caso é uma função que executa o callback e devolve o tamanho do JSON
+	gestacoes = sys.modules['gestacoes']
+	imunizacoes = sys.modules['imunizacoes']
+	mortalidade = sys.modules['mortalidade']
+	partos = sys.modules['partos']
+	agua = sys.modules['agua']
+	eixos = [[], ['x'], ['y'], ['x', 'y']]
+
+	return {
+		'gestacoes.updateFig': [
+			direto(gestacoes.updateFig, ano, idioma)
+			for ano in gestacoes.ANOS for idioma in IDIOMAS
+		],
+		'imunizacoes.updateGraph': [
+			viaServidor('imunizacoes', '..graph.figure...iniciado.data..',
+						{ 'slider-ano': ano, 'eixos-fixos': e, 'idioma': idioma, 'iniciado': True }, 'slider-ano.value')
+			for ano in imunizacoes.ANOS for e in eixos for idioma in IDIOMAS
+		],
+		'imunizacoes.updateGraph[idioma]': [
+			viaServidor('imunizacoes', '..graph.figure...iniciado.data..',
+						{ 'slider-ano': ano, 'eixos-fixos': [], 'idioma': idioma, 'iniciado': True }, 'idioma.value')
+			for ano in imunizacoes.ANOS for idioma in IDIOMAS
+		],
+		'mortalidade.updateGraph': [
+			viaServidor('mortalidade', 'graph.figure',
+						{ 'dropdown': uf, 'slider-year': ano, 'idioma': idioma }, 'dropdown.value')
+			for uf in UFS['Sigla'] for ano in mortalidade.ANOS for idioma in IDIOMAS
+		],
+		'partos.montarFigura': [
+			direto(partos.montarFigura, idioma, transic)
+			for transic in range(0, 1001, 100) for idioma in IDIOMAS
+		],
+		'agua.update_output': [
+			viaServidor('agua', 'relacao-agua.figure', { 'dd-estado': estado, 'idioma': idioma }, 'dd-estado.value')
+			for estado in ['*'] + [int(c) for c in UFS.index] for idioma in IDIOMAS
+		],
+	}
+
+def medir(casos, repeticoes):
+	for caso in casos:
+		caso()
+
+	tempos = []
+	for _ in range(repeticoes):
+		for caso in casos:
+			inicio = time.perf_counter()
+			caso()
+			tempos.append((time.perf_counter() - inicio) * 1000)
+
+	# Memória numa passada separada, já que o tracemalloc deixa tudo mais lento
+	tracemalloc.start()
+	tamanhos = [caso() for caso in casos]
+	pico = tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+
+	return {
+		'casos': len(casos),
+		'repeticoes': repeticoes,
+		'p50_ms': round(float(np.percentile(tempos, 50)), 3),
+		'p95_ms': round(float(np.percentile(tempos, 95)), 3),
+		'p99_ms': round(float(np.percentile(tempos, 99)), 3),
+		'max_ms': round(max(tempos), 3),
+		'pico_memoria_kb': round(pico / 1024, 1),
+		'json_medio_bytes': int(np.mean(tamanhos)),
+		'json_max_bytes': max(tamanhos),
+	}
+
+def comparar(resultados, base, tolerancia):
+	# Razão novo/base de cada métrica; devolve os grupos em que o p95 piorou além da tolerância
+	piores = []
+	print('\n%-34s %10s %10s %10s' % ('comparação com a base', 'p50', 'p95', 'json'))
+	for nome, r in resultados.items():
+		if nome not in base:
+			continue
+		b = base[nome]
+		razao = lambda k: r[k] / b[k] if b[k] else float('nan')
+		print('%-34s %9.2fx %9.2fx %9.2fx' % (nome, razao('p50_ms'), razao('p95_ms'), razao('json_medio_bytes')))
+		if razao('p95_ms') > 1 + tolerancia:
+			piores.append(nome)
+	return piores
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description = 'Benchmark dos callbacks das visualizações')
+	parser.add_argument('--saida', help = 'arquivo JSON onde gravar os resultados')
+	parser.add_argument('--base', help = 'resultados anteriores (JSON) para comparar')
+	parser.add_argument('--repeticoes', type = int, default = 5, help = 'vezes que cada caso é executado (padrão: 5)')
+	parser.add_argument('--tolerancia', type = float, default = 0.2, help = 'piora aceita no p95 em relação à base (padrão: 0.2)')
+	parser.add_argument('--grupo', action = 'append', help = 'mede só os grupos indicados (pode repetir)')
+	args = parser.parse_args()
+
+	resultados = {}
+	print('%-34s %6s %9s %9s %9s %11s %11s' % ('grupo', 'casos', 'p50 ms', 'p95 ms', 'p99 ms', 'pico KiB', 'json bytes'))
+	for nome, casos in grupos().items():
+		if args.grupo and nome not in args.grupo:
+			continue
+		r = resultados[nome] = medir(casos, args.repeticoes)
+		print('%-34s %6d %9.2f %9.2f %9.2f %11.1f %11d' % (nome, r['casos'], r['p50_ms'], r['p95_ms'], r['p99_ms'], r['pico_memoria_kb'], r['json_medio_bytes']))
+
+	if args.saida:
+		with open(args.saida, 'w') as f:
+			json.dump({
+				'data': datetime.datetime.now().isoformat(timespec = 'seconds'),
+				'ambiente': {
+					'python': platform.python_version(),
+					'pandas': pd.__version__,
+					'numpy': np.__version__,
+					'plotly': plotly.__version__,
+					'dash': dash.__version__,
+					'cache_figuras': figuras.ATIVO,
+				},
+				'resultados': resultados,
+			}, f, indent = 2)
+
+	if args.base:
+		with open(args.base) as f:
+			base = json.load(f)
+		# Com e sem o cache os tempos medem coisas diferentes (resposta pronta ou montagem)
+		cacheBase = base.get('ambiente', {}).get('cache_figuras')
+		if cacheBase != figuras.ATIVO:
+			print('\na base foi medida com o cache de figuras %s e esta medição com ele %s; rode as duas com o mesmo COTB_FIGURAS'
+				  % ({ True: 'ligado', False: 'desligado', None: 'em estado desconhecido' }[cacheBase],
+					 'ligado' if figuras.ATIVO else 'desligado'))
+			sys.exit(2)
+		piores = comparar(resultados, base['resultados'], args.tolerancia)
+		if piores:
+			print('\np95 acima da tolerância: %s' % ', '.join(piores))
+			sys.exit(1)
@@ -0,0 +1,65 @@
+# Compressão e ETag das respostas do Dash (layout e callbacks), para quem acessa por conexões lentas.
+# O ETag é o hash do conteúdo: como cada resposta só depende das entradas, a mesma resposta tem sempre o mesmo
+# ETag, e um If-None-Match igual recebe 304 sem corpo. Os navegadores só revalidam sozinhos os GET (o layout);
+# os callbacks vão por POST, e aí as entradas repetidas já saem prontas do cache de comum/figuras.py.
+import gzip, hashlib
+import flask
+
+try:
+	import brotli
+except ImportError:
+	brotli = None
+
+# Finais de caminho tratados aqui, em todas as rotas dos apps
+ROTAS = ('/_dash-update-component', '/_dash-layout')
+# Abaixo disto, comprimir não compensa
+MINIMO = 500
+# (ETag, codificação) -> corpo comprimido; as respostas se repetem muito, ainda mais com o cache de figuras
+LIMITE = 4096
+_comprimidas = {}
+
+def _comprimir(corpo, codificacao):
+	if codificacao == 'br':
+		return brotli.compress(corpo, quality = 5)
+	return gzip.compress(corpo, 6, mtime = 0)
+
+def escolherCodificacao(disponiveis):
+	# A de maior q no Accept-Encoding da requisição, entre as disponíveis (no empate, a primeira delas).
+	# q=0 é recusa: 'gzip;q=0' não aceita gzip, e '*' vale para as que não aparecem pelo nome
+	aceitas = flask.request.accept_encodings
+	opcoes = [c for c in disponiveis if aceitas.quality(c) > 0]
+	return max(opcoes, key = aceitas.quality, default = None)
+
+def tratar(resposta):
+	if not flask.request.path.endswith(ROTAS) or resposta.status_code != 200 or \
+	   resposta.direct_passthrough or 'Content-Encoding' in resposta.headers:
+		return resposta
+
+	corpo = resposta.get_data()
+	codificacao = escolherCodificacao(['br', 'gzip'] if brotli is not None else ['gzip']) if len(corpo) >= MINIMO else None
+	# Um ETag por representação: a versão comprimida não é igual byte a byte à original
+	etag = hashlib.sha1(corpo).hexdigest()[:20] + ('-' + codificacao if codificacao else '')
+	resposta.headers['Vary'] = 'Accept-Encoding'
+	resposta.set_etag(etag)
+
+	if etag in flask.request.if_none_match:
+		resposta.status_code = 304
+		resposta.set_data(b'')
+		resposta.headers.pop('Content-Type', None)
+		return resposta
+
+	if codificacao:
+		comprimido = _comprimidas.get((etag, codificacao))
+		if comprimido is None:
+			comprimido = _comprimir(corpo, codificacao)
+			if len(_comprimidas) >= LIMITE:
+				_comprimidas.clear()
+			_comprimidas[(etag, codificacao)] = comprimido
+		resposta.set_data(comprimido)
+		resposta.headers['Content-Encoding'] = codificacao
+	return resposta
+
+def registrar(server):
+	if not server.extensions.get('cotbCompressao'):
+		server.extensions['cotbCompressao'] = True
+		server.after_request(tratar)
@@ -0,0 +1,77 @@
+# Leitura das fontes (CSV e XLSX) com cache colunar em disco.
+# Na primeira leitura o arquivo é convertido, já com os tipos compactados, para Feather (ou pickle, sem o pyarrow)
+# numa pasta .cache ao lado da fonte; as próximas leituras vão direto ao cache enquanto o arquivo não mudar.
+# A pasta .cache pode ser apagada a qualquer momento.
+import os, hashlib
+import numpy as np
+import pandas as pd
+
+try:
+	import pyarrow
+	FORMATO = 'feather'
+except ImportError:
+	FORMATO = 'pickle'
+
+# Muda quando a forma de compactar muda, para invalidar os caches antigos
+VERSAO = 1
+
+# Chave de cada leitura feita neste processo; a versão dos dados é o hash delas (ver versaoDados)
+_lidas = set()
+
+def _chave(caminho, planilha, categorias, kwargs):
+	# Caminho, data de modificação e tamanho da fonte, mais tudo o que muda o resultado da leitura
+	info = os.stat(caminho)
+	texto = '|'.join(str(x) for x in [
+		os.path.abspath(caminho), info.st_mtime_ns, info.st_size, planilha,
+		sorted(categorias), sorted(kwargs.items()), FORMATO, VERSAO,
+	])
+	return hashlib.sha1(texto.encode('utf-8')).hexdigest()[:16]
+
+def _compactar(df, categorias):
+	# Inteiros viram int32 quando cabem; os floats ficam em float64, já que float32 mudaria os valores exibidos
+	df.columns = df.columns.astype(str)
+	for col in df.columns:
+		s = df[col]
+		if col in categorias:
+			df[col] = s.astype('category')
+		elif pd.api.types.is_integer_dtype(s) and len(s) and \
+			 np.iinfo(np.int32).min <= s.min() and s.max() <= np.iinfo(np.int32).max:
+			df[col] = s.astype(np.int32)
+	return df
+
+def _lerFonte(caminho, planilha, kwargs):
+	if caminho.endswith(('.xlsx', '.xls')):
+		return pd.read_excel(caminho, planilha or 0, **kwargs)
+	return pd.read_csv(caminho, **kwargs)
+
+def lerTabela(caminho, planilha = None, indice = None, categorias = (), **kwargs):
+	# Os nomes das colunas sempre saem como texto, tanto da fonte quanto do cache
+	pasta = os.path.join(os.path.dirname(os.path.abspath(caminho)), '.cache')
+	nome = os.path.basename(caminho) + ('' if planilha is None else '-%s' % planilha)
+	chave = _chave(caminho, planilha, categorias, kwargs)
+	arquivo = os.path.join(pasta, '%s-%s.%s' % (nome, chave, FORMATO))
+	_lidas.add(chave)
+
+	if os.path.exists(arquivo):
+		df = pd.read_feather(arquivo) if FORMATO == 'feather' else pd.read_pickle(arquivo)
+	else:
+		df = _compactar(_lerFonte(caminho, planilha, kwargs), categorias)
+		try:
+			os.makedirs(pasta, exist_ok = True)
+			# Escreve num temporário e troca de uma vez, para vários processos poderem subir juntos
+			temp = '%s.%d.tmp' % (arquivo, os.getpid())
+			if FORMATO == 'feather':
+				df.to_feather(temp)
+			else:
+				df.to_pickle(temp)
+			os.replace(temp, arquivo)
+		except OSError as e:
+			print('%s: cache não gravado (%s)' % (caminho, e))
+
+	if indice is not None:
+		df = df.set_index(indice)
+	return df
+
+def versaoDados():
+	# Muda sempre que qualquer fonte lida pelo processo muda (caminho, data de modificação ou tamanho)
+	return hashlib.sha1('|'.join(sorted(_lidas)).encode('utf-8')).hexdigest()[:16]
@@ -0,0 +1,103 @@
+# Folhas de estilo das visualizações servidas do próprio servidor, e não de codepen/pastebin.
+# O pacote fica em assets/, na raiz: cada folha com o hash do conteúdo no nome, já comprimida em gzip
+# (e em brotli, com o módulo brotli instalado), e servida em /estilos/ com cache imutável de um ano.
+#
+#   python -m comum.estilos             baixa as folhas de ORIGENS e monta o pacote (uma vez, com acesso à internet)
+#   python -m comum.estilos --empacotar  só remonta o pacote, depois de editar os .css de assets/ à mão
+#
+# Enquanto o pacote não existe, folhas() devolve os endereços originais, e servidor.py avisa no boot.
+import gzip, hashlib, json, os, sys, urllib.request
+import flask
+from comum.compressao import escolherCodificacao
+
+try:
+	import brotli
+except ImportError:
+	brotli = None
+
+PASTA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets')
+MANIFESTO = os.path.join(PASTA, 'manifesto.json')
+ROTA = '/estilos/'
+# Um ano: o nome muda junto com o conteúdo, então o navegador nunca precisa perguntar de novo
+CACHE = 'public, max-age=31536000, immutable'
+
+# Nome local de cada folha -> endereço de onde ela veio
+ORIGENS = {
+	'base.css': 'https://codepen.io/chriddyp/pen/bWLwgP.css',
+	'agua.css': 'https://pastebin.com/raw/gUTNSAa4',
+}
+
+def _lerManifesto():
+	if not os.path.exists(MANIFESTO):
+		return {}
+	with open(MANIFESTO, encoding = 'utf-8') as f:
+		return json.load(f)
+
+# Nome local -> nome com o hash; lido uma vez, no import
+manifesto = _lerManifesto()
+
+def faltando():
+	# Folhas de ORIGENS que não estão no pacote
+	return sorted(nome for nome in ORIGENS if nome not in manifesto)
+
+def folhas(*nomes):
+	# Para o external_stylesheets de cada app
+	return [ROTA + manifesto[nome] if nome in manifesto else ORIGENS[nome] for nome in nomes]
+
+def servir(arquivo):
+	if arquivo not in manifesto.values():
+		flask.abort(404)
+	extensoes = { 'br': '.br', 'gzip': '.gz' }
+	codificacao = escolherCodificacao([c for c in extensoes if os.path.exists(os.path.join(PASTA, arquivo + extensoes[c]))])
+	if codificacao:
+		resposta = flask.send_from_directory(PASTA, arquivo + extensoes[codificacao], mimetype = 'text/css')
+		resposta.headers['Content-Encoding'] = codificacao
+	else:
+		resposta = flask.send_from_directory(PASTA, arquivo, mimetype = 'text/css')
+	resposta.headers['Cache-Control'] = CACHE
+	resposta.headers['Vary'] = 'Accept-Encoding'
+	return resposta
+
+def registrar(server):
+	if 'estilos' not in server.view_functions:
+		server.add_url_rule(ROTA + '<arquivo>', 'estilos', servir)
+
+def baixar():
+	os.makedirs(PASTA, exist_ok = True)
+	for nome, url in ORIGENS.items():
+		print('%s <- %s' % (nome, url))
+		with urllib.request.urlopen(url, timeout = 30) as r:
+			conteudo = r.read()
+		with open(os.path.join(PASTA, nome), 'wb') as f:
+			f.write(conteudo)
+
+def empacotar():
+	# Apaga as versões anteriores e gera, para cada .css, a cópia com hash e as comprimidas
+	for arquivo in os.listdir(PASTA):
+		if arquivo.endswith(('.gz', '.br')) or arquivo.count('.') > 1:
+			os.remove(os.path.join(PASTA, arquivo))
+
+	novo = {}
+	for nome in sorted(ORIGENS):
+		with open(os.path.join(PASTA, nome), 'rb') as f:
+			conteudo = f.read()
+		raiz, extensao = os.path.splitext(nome)
+		arquivo = '%s.%s%s' % (raiz, hashlib.sha256(conteudo).hexdigest()[:12], extensao)
+		with open(os.path.join(PASTA, arquivo), 'wb') as f:
+			f.write(conteudo)
+		# mtime fixo, para o .gz não mudar a cada empacotamento
+		with open(os.path.join(PASTA, arquivo + '.gz'), 'wb') as f:
+			f.write(gzip.compress(conteudo, 9, mtime = 0))
+		if brotli is not None:
+			with open(os.path.join(PASTA, arquivo + '.br'), 'wb') as f:
+				f.write(brotli.compress(conteudo, quality = 11))
+		novo[nome] = arquivo
+		print('%s -> %s' % (nome, arquivo))
+
+	with open(MANIFESTO, 'w', encoding = 'utf-8') as f:
+		json.dump(novo, f, indent = 1, sort_keys = True)
+
+if __name__ == '__main__':
+	if '--empacotar' not in sys.argv:
+		baixar()
+	empacotar()
@@ -0,0 +1,160 @@
+# Cache das respostas dos callbacks de figura, com chave nos valores das entradas.
+# Os domínios das entradas são pequenos e finitos, então cada visualização declara o seu com cachearFiguras
+# e servidor.py chama prepararFiguras no boot, que monta todas as respostas num pool de processos.
+# Daí em diante o callback devolve o JSON já pronto, sem passar pelo plotly.
+#
+#   COTB_FIGURAS=0              desliga o cache (para medir a montagem com o benchmark, por exemplo)
+#   COTB_FIGURAS_DISCO=pasta    guarda as respostas em disco, para os outros workers e os próximos boots
+#   COTB_FIGURAS_PROCESSOS=n    processos usados no preparo (padrão: um por CPU)
+import glob, hashlib, itertools, json, multiprocessing, os, sys, time
+import concurrent.futures
+import dash
+import plotly
+from comum import dados, metricas
+
+ATIVO = os.environ.get('COTB_FIGURAS') != '0'
+DISCO = os.environ.get('COTB_FIGURAS_DISCO')
+PROCESSOS = int(os.environ.get('COTB_FIGURAS_PROCESSOS') or os.cpu_count() or 1)
+# Um por callback declarado: app, chave no callback_map, domínio, disparos, as chaves do domínio e as respostas já montadas
+_caches = []
+
+def corpoCallback(app, chave, valores, disparo):
+	# Corpo da requisição montado a partir do callback_map, com os valores de cada entrada pelo id
+	cb = app.callback_map[chave]
+	if chave.startswith('..'):
+		saidas = [dict(zip(['id', 'property'], s.rsplit('.', 1))) for s in chave[2:-2].split('...')]
+	else:
+		saidas = dict(zip(['id', 'property'], chave.rsplit('.', 1)))
+	return {
+		'output': chave,
+		'outputs': saidas,
+		'inputs': [dict(e, value = valores[e['id']]) for e in cb['inputs']],
+		'state': [dict(e, value = valores[e['id']]) for e in cb['state']],
+		'changedPropIds': [disparo],
+	}
+
+def _chave(entradas, estados, disparados, disparos):
+	# Só os disparos que mudam a resposta entram na chave; os demais dão na mesma figura
+	return json.dumps([
+		[e.get('value') for e in entradas],
+		[e.get('value') for e in estados],
+		sorted(d for d in disparados if d in disparos),
+	], sort_keys = True, separators = (',', ':'))
+
+def _envolver(cache, callback):
+	def chamar(*args, **kwargs):
+		g = kwargs['callback_context']
+		chave = _chave(g.inputs_list, g.states_list, [t['prop_id'] for t in g.triggered_inputs], cache['disparos'])
+		resposta = cache['respostas'].get(chave)
+		metricas.contarCache(resposta is not None)
+		if resposta is None:
+			resposta = callback(*args, **kwargs)
+			# Um cliente pode mandar valores fora do domínio: essas respostas são montadas, mas não guardadas
+			if chave in cache['chaves']:
+				cache['respostas'][chave] = resposta
+		return resposta
+	return chamar
+
+def cachearFiguras(app, saida, dominio, disparos = ()):
+	# saida: chave do callback no callback_map ('graph.figure'); dominio: id da entrada -> valores possíveis;
+	# disparos: entradas (id.propriedade) que mudam a resposta quando são elas que disparam o callback
+	if not ATIVO:
+		return
+	cache = { 'app': app, 'saida': saida, 'dominio': dominio, 'disparos': set(disparos), 'respostas': {} }
+	cache['chaves'] = set(_chave(c['inputs'], c['state'], c['changedPropIds'], cache['disparos']) for c in _corpos(cache))
+	_caches.append(cache)
+
+	# Fica por baixo das métricas, para que elas meçam também as respostas vindas do cache
+	cb = app.callback_map[saida]
+	if hasattr(cb['callback'], 'interno'):
+		cb['callback'].interno = _envolver(cache, cb['callback'].interno)
+	else:
+		cb['callback'] = _envolver(cache, cb['callback'])
+
+def _corpos(cache):
+	app, saida = cache['app'], cache['saida']
+	cb = app.callback_map[saida]
+	ids = list(cache['dominio'])
+	primeira = '%s.%s' % (cb['inputs'][0]['id'], cb['inputs'][0]['property'])
+	disparos = [primeira] + sorted(cache['disparos'] - {primeira})
+	for valores in itertools.product(*(cache['dominio'][i] for i in ids)):
+		for disparo in disparos:
+			yield corpoCallback(app, saida, dict(zip(ids, valores)), disparo)
+
+def _montar(indice, corpos):
+	# Roda nos processos do pool (ou no próprio, sem fork): cada corpo passa pelo Dash como uma requisição normal
+	cache = _caches[indice]
+	app = cache['app']
+	cliente = app.server.test_client()
+	url = app.config.requests_pathname_prefix + '_dash-update-component'
+	respostas = {}
+	for corpo in corpos:
+		r = cliente.post(url, json = corpo)
+		if r.status_code == 200:
+			chave = _chave(corpo['inputs'], corpo['state'], corpo['changedPropIds'], cache['disparos'])
+			respostas[chave] = r.get_data(as_text = True)
+	return indice, respostas
+
+def _versao(cache):
+	# Muda com os dados lidos, com o código da visualização e de comum, e com as versões do Dash e do plotly
+	modulo = sys.modules[cache['app'].config.name]
+	arquivos = [modulo.__file__] + sorted(
+		os.path.join(os.path.dirname(__file__), f) for f in os.listdir(os.path.dirname(__file__)) if f.endswith('.py')
+	)
+	texto = '|'.join([dados.versaoDados(), dash.__version__, plotly.__version__, cache['saida'],
+					  json.dumps(cache['dominio'], sort_keys = True)] +
+					 ['%s:%d:%d' % (f, os.stat(f).st_mtime_ns, os.stat(f).st_size) for f in arquivos])
+	return hashlib.sha1(texto.encode('utf-8')).hexdigest()[:16]
+
+def _arquivo(cache, versao = None):
+	nome = cache['app'].config.requests_pathname_prefix.strip('/') or cache['app'].config.name
+	return os.path.join(DISCO, '%s-%s.json' % (nome, versao or _versao(cache)))
+
+def _gravar(cache):
+	try:
+		os.makedirs(DISCO, exist_ok = True)
+		arquivo = _arquivo(cache)
+		temp = '%s.%d.tmp' % (arquivo, os.getpid())
+		with open(temp, 'w', encoding = 'utf-8') as f:
+			json.dump(cache['respostas'], f, ensure_ascii = False)
+		os.replace(temp, arquivo)
+		# As versões anteriores da mesma visualização não servem mais
+		for antigo in glob.glob(_arquivo(cache, '*')):
+			if antigo != arquivo:
+				os.remove(antigo)
+	except OSError as e:
+		print('%s: figuras não gravadas (%s)' % (cache['saida'], e))
+
+def prepararFiguras():
+	# Monta (ou lê do disco) as respostas de todo o domínio de cada callback declarado
+	if not _caches:
+		return
+	inicio = time.perf_counter()
+	tarefas = []
+	for indice, cache in enumerate(_caches):
+		if DISCO and os.path.exists(_arquivo(cache)):
+			with open(_arquivo(cache), encoding = 'utf-8') as f:
+				cache['respostas'].update(json.load(f))
+			continue
+		corpos = list(_corpos(cache))
+		# Lotes pequenos o bastante para dividir bem o trabalho entre os processos
+		tamanho = max(1, len(corpos) // (PROCESSOS * 4))
+		tarefas += [(indice, corpos[i:i + tamanho]) for i in range(0, len(corpos), tamanho)]
+
+	if PROCESSOS > 1 and len(tarefas) > 1 and 'fork' in multiprocessing.get_all_start_methods():
+		contexto = multiprocessing.get_context('fork')
+		with concurrent.futures.ProcessPoolExecutor(PROCESSOS, mp_context = contexto) as pool:
+			resultados = list(pool.map(_montar, *zip(*tarefas)))
+	else:
+		resultados = [_montar(indice, corpos) for indice, corpos in tarefas]
+
+	for indice, respostas in resultados:
+		_caches[indice]['respostas'].update(respostas)
+	if DISCO:
+		for indice in sorted(set(indice for indice, _ in tarefas)):
+			_gravar(_caches[indice])
+
+	# As requisições do preparo não são tráfego de verdade
+	metricas.zerarMetricas()
+	total = sum(len(c['respostas']) for c in _caches)
+	print('figuras: %d respostas prontas em %.1f s' % (total, time.perf_counter() - inicio))
@@ -0,0 +1,26 @@
+# Formatação vetorizada de números para os textos das visualizações.
+# Recebem arrays (ou matrizes inteiras, como o pib.csv) e devolvem um ndarray de strings do mesmo formato.
+import numpy as np
+
+SUFIXOS = {
+	'pt': np.array(['mil', 'milhões', 'bilhões', 'trilhões']),
+	'en': np.array(['thousand', 'million', 'billion', 'trillion']),
+}
+
+def formatarNumeros(valores, formato):
+	# Ex.: formatarNumeros(v, '%.2f%%') ou formatarNumeros(v, '%.2f por mil')
+	return np.char.mod(formato, np.asarray(valores))
+
+def formatarMoeda(valores, idioma = 'pt'):
+	# Valores em milhares de reais -> 'R$23.9 bilhões', com o primeiro grupo de dígitos e uma casa decimal se não for zero
+	v = np.asarray(valores, dtype = np.int64) * 1000
+	digitos = np.char.str_len(v.astype(str))
+	grupos = (digitos - 1) // 3
+
+	inicio = v // (10 ** (3 * grupos))
+	decimal = np.where(grupos > 0, (v // (10 ** np.maximum(3 * grupos - 1, 0))) % 10, 0)
+	sufixo = np.select([digitos >= 13, digitos >= 10, digitos >= 7], [3, 2, 1], 0)
+
+	texto = np.char.add('R$', inicio.astype(str))
+	texto = np.where(decimal != 0, np.char.add(np.char.add(texto, '.'), decimal.astype(str)), texto)
+	return np.char.add(np.char.add(texto, ' '), SUFIXOS[idioma][sufixo])
@@ -0,0 +1,54 @@
+# Montagem das figuras como dicionários simples, já no formato do plotly.js, sem os graph_objs.
+# Os graph_objs (e o make_subplots) validam cada propriedade de cada trace, o que custa mais do que montar
+# a figura inteira com dados deste tamanho. Com COTB_VALIDAR_FIGURAS=1 cada figura montada aqui passa
+# pela validação do plotly mesmo assim, e um nome de propriedade errado vira exceção na hora.
+import os
+import plotly.graph_objs as go
+import plotly.io as pio
+
+VALIDAR = os.environ.get('COTB_VALIDAR_FIGURAS') == '1'
+
+# O mesmo template que o go.Figure aplica sozinho; sem ele o plotly.js usa o visual padrão dele
+TEMA = pio.templates[pio.templates.default].to_plotly_json()
+
+def traco(tipo, coluna = None, **props):
+	# coluna (a partir de 1) põe o trace nos eixos daquele subplot, como o row/col do add_trace
+	props['type'] = tipo
+	if coluna is not None:
+		sufixo = str(coluna) if coluna > 1 else ''
+		props['xaxis'] = 'x' + sufixo
+		props['yaxis'] = 'y' + sufixo
+	return props
+
+def subplots(colunas, titulos = None, espacamento = 0.2):
+	# Eixos e títulos de uma linha de subplots lado a lado, com os mesmos domínios do make_subplots
+	largura = (1 - espacamento * (colunas - 1)) / colunas
+	layout = { 'annotations': [] }
+	for c in range(colunas):
+		sufixo = str(c + 1) if c else ''
+		inicio = c * (largura + espacamento)
+		layout['xaxis' + sufixo] = { 'anchor': 'y' + sufixo, 'domain': [inicio, min(inicio + largura, 1.0)] }
+		layout['yaxis' + sufixo] = { 'anchor': 'x' + sufixo, 'domain': [0.0, 1.0] }
+		if titulos:
+			layout['annotations'].append({
+				'font': { 'size': 16 },
+				'showarrow': False,
+				'text': titulos[c],
+				'x': inicio + largura / 2,
+				'xanchor': 'center',
+				'xref': 'paper',
+				'y': 1.0,
+				'yanchor': 'bottom',
+				'yref': 'paper',
+			})
+	return layout
+
+def figura(data, layout, tema = False):
+	# tema: inclui o template padrão, como nas figuras que antes saíam de um go.Figure
+	fig = { 'data': data, 'layout': layout }
+	if tema:
+		layout['template'] = TEMA
+	# Os arrays do numpy ficam como estão: comum/serializacao.py decide como eles vão no JSON
+	if VALIDAR:
+		go.Figure(fig)
+	return fig
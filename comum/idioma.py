@@ -0,0 +1,46 @@
+# Troca de idioma em tempo de execução, com um único servidor para pt e en.
+# O idioma vem do seletor na página ou do parâmetro ?lang=pt|en da URL; os textos fixos são trocados no navegador.
+import json
+from dash import dcc, html
+from dash.dependencies import Input, Output
+
+IDIOMAS = ['pt', 'en']
+IDIOMA_PADRAO = 'pt'
+
+def seletorIdioma():
+	return html.Div(
+		children = [
+			dcc.Location(id = 'url', refresh = False),
+			dcc.RadioItems(
+				id = 'idioma',
+				options = [
+					{ 'label': 'Português', 'value': 'pt' },
+					{ 'label': 'English', 'value': 'en' },
+				],
+				value = IDIOMA_PADRAO,
+				inline = True,
+			),
+		],
+		style = {
+			'text-align': 'right',
+		}
+	)
+
+def registrarIdioma(app, textos, componentes):
+	# componentes: { id do componente: (propriedade, chave em textos[idioma]) }
+	app.clientside_callback(
+		'''function(search) {
+			var idioma = new URLSearchParams(search || '').get('lang');
+			return %s.indexOf(idioma) >= 0 ? idioma : window.dash_clientside.no_update;
+		}''' % json.dumps(IDIOMAS),
+		Output('idioma', 'value'),
+		[Input('url', 'search')],
+	)
+
+	ids = list(componentes)
+	traducoes = { idioma: [textos[idioma][componentes[i][1]] for i in ids] for idioma in IDIOMAS }
+	app.clientside_callback(
+		'function(idioma) { return (%s)[idioma]; }' % json.dumps(traducoes),
+		[Output(i, componentes[i][0]) for i in ids],
+		[Input('idioma', 'value')],
+	)
@@ -0,0 +1,240 @@
+# Métricas dos callbacks de servidor de todos os apps, sem mudar nada em cada visualização:
+# instrumentar(app, nome) mede cada callback registrado depois dele, e /metrics expõe tudo no formato texto do Prometheus.
+# Com COTB_LOG_CALLBACKS=1 cada chamada também gera uma linha de log em JSON (logger 'cotb.callbacks').
+#
+# Cada processo conta só as chamadas que ele atendeu. Com vários workers (gunicorn -w), use
+# COTB_METRICAS_PASTA=pasta: cada processo grava os seus contadores num arquivo dessa pasta (no máximo uma vez
+# por INTERVALO) e o /metrics soma todos, como o modo multiprocesso do prometheus_client. Os arquivos de workers
+# que já saíram continuam somando, para os contadores nunca voltarem; esvazie a pasta antes de subir o servidor.
+import bisect, contextvars, glob, json, logging, os, threading, time
+import dash
+import flask
+
+# Limites (em segundos) dos baldes do histograma de tempo total
+BALDES = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5]
+LOG = os.environ.get('COTB_LOG_CALLBACKS') == '1'
+PASTA = os.environ.get('COTB_METRICAS_PASTA')
+# Segundos entre duas gravações dos contadores de um processo na PASTA
+INTERVALO = 1.0
+logger = logging.getLogger('cotb.callbacks')
+
+_trava = threading.Lock()
+# (app, callback) -> contadores
+_series = {}
+# Gravação agendada na PASTA; não passa para os processos filhos, que têm os próprios contadores
+_agendada = None
+# Medições da chamada em andamento: tempo da função e acertos de cache
+_atual = contextvars.ContextVar('metricasCallback', default = None)
+
+def _novaSerie():
+	return {
+		'chamadas': 0,
+		'erros': 0,
+		'baldes': [0] * (len(BALDES) + 1),
+		'segundos': 0.0,
+		'construcao': 0.0,
+		'serializacao': 0.0,
+		'bytes': 0,
+		'acertos': 0,
+		'faltas': 0,
+	}
+
+def contarCache(acerto):
+	# Para os caches de figura: conta um acerto ou uma falta no callback em andamento
+	atual = _atual.get()
+	if atual is not None:
+		atual['acertos' if acerto else 'faltas'] += 1
+
+def _arquivo(pid = None):
+	return os.path.join(PASTA, '%d.json' % (pid or os.getpid()))
+
+def _gravar():
+	global _agendada
+	with _trava:
+		_agendada = None
+		texto = json.dumps([[nome, chave, s] for (nome, chave), s in _series.items()])
+	try:
+		os.makedirs(PASTA, exist_ok = True)
+		temp = _arquivo() + '.tmp'
+		with open(temp, 'w', encoding = 'utf-8') as f:
+			f.write(texto)
+		os.replace(temp, _arquivo())
+	except OSError as e:
+		print('metricas: contadores não gravados (%s)' % e)
+
+def _agendar():
+	# Chamado com a trava: uma gravação por INTERVALO, e a última chamada sempre acaba gravada
+	global _agendada
+	if _agendada is None:
+		_agendada = threading.Timer(INTERVALO, _gravar)
+		_agendada.daemon = True
+		_agendada.start()
+
+def _esquecerAgendada():
+	global _agendada
+	_agendada = None
+
+os.register_at_fork(after_in_child = _esquecerAgendada)
+
+def zerarMetricas():
+	with _trava:
+		_series.clear()
+		if _agendada is not None:
+			_agendada.cancel()
+			_esquecerAgendada()
+	if PASTA and os.path.exists(_arquivo()):
+		os.remove(_arquivo())
+
+def _medirConstrucao(func):
+	def construir(*args, **kwargs):
+		inicio = time.perf_counter()
+		try:
+			return func(*args, **kwargs)
+		finally:
+			atual = _atual.get()
+			if atual is not None:
+				atual['construcao'] += time.perf_counter() - inicio
+				atual['executou'] = True
+				if LOG:
+					atual['entradas'] = dash.ctx.inputs
+	construir.__name__ = func.__name__
+	construir.__wrapped__ = func
+	return construir
+
+def _medirCallback(nome, chave, callback):
+	# Envolve o callback do Dash: o tempo além da função é o preparo e a serialização da resposta.
+	# O callback fica em chamar.interno, onde outras camadas (o cache de figuras) podem se encaixar por baixo;
+	# quando a resposta vem pronta do cache, a função não roda e não há serialização a contar.
+	def chamar(*args, **kwargs):
+		atual = { 'construcao': 0.0, 'executou': False, 'acertos': 0, 'faltas': 0 }
+		token = _atual.set(atual)
+		inicio = time.perf_counter()
+		resposta, erro = None, False
+		try:
+			resposta = chamar.interno(*args, **kwargs)
+			return resposta
+		except dash.exceptions.PreventUpdate:
+			raise
+		except Exception:
+			erro = True
+			raise
+		finally:
+			total = time.perf_counter() - inicio
+			_atual.reset(token)
+			# Bytes de verdade: o JSON sai em UTF-8, e os textos em português têm acentos
+			if isinstance(resposta, str):
+				tamanho = len(resposta.encode('utf-8'))
+			else:
+				tamanho = len(resposta) if isinstance(resposta, bytes) else 0
+			_registrar(nome, chave, total, atual, tamanho, erro)
+	chamar.interno = callback
+	return chamar
+
+def _registrar(nome, chave, total, atual, tamanho, erro):
+	serializacao = total - atual['construcao'] if atual['executou'] else 0.0
+	with _trava:
+		s = _series.setdefault((nome, chave), _novaSerie())
+		s['chamadas'] += 1
+		s['erros'] += erro
+		s['baldes'][bisect.bisect_left(BALDES, total)] += 1
+		s['segundos'] += total
+		s['construcao'] += atual['construcao']
+		s['serializacao'] += serializacao
+		s['bytes'] += tamanho
+		s['acertos'] += atual['acertos']
+		s['faltas'] += atual['faltas']
+		if PASTA:
+			_agendar()
+
+	if LOG:
+		logger.info(json.dumps({
+			'app': nome,
+			'callback': chave,
+			'entradas': atual.get('entradas'),
+			'total_ms': round(total * 1000, 3),
+			'construcao_ms': round(atual['construcao'] * 1000, 3),
+			'serializacao_ms': round(serializacao * 1000, 3),
+			'bytes': tamanho,
+			'cache_acertos': atual['acertos'],
+			'cache_faltas': atual['faltas'],
+			'erro': erro,
+		}, default = str))
+
+def instrumentar(app, nome):
+	# Troca app.callback por uma versão que mede a função e o callback completo de cada registro
+	registrar = app.callback
+	def callback(*args, **kwargs):
+		antes = set(app.callback_map)
+		decorador = registrar(*args, **kwargs)
+		def envolver(func):
+			resultado = decorador(_medirConstrucao(func))
+			for chave in set(app.callback_map) - antes:
+				cb = app.callback_map[chave]
+				cb['callback'] = _medirCallback(nome, chave, cb['callback'])
+			return resultado
+		return envolver
+	app.callback = callback
+
+	if 'metricas' not in app.server.view_functions:
+		app.server.add_url_rule('/metrics', 'metricas', metricas)
+	return app
+
+def _rotulos(nome, chave, extra = ''):
+	escapar = lambda v: str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+	return '{app="%s",callback="%s"%s}' % (escapar(nome), escapar(chave), extra)
+
+def _somar(series, nome, chave, s):
+	total = series.setdefault((nome, chave), _novaSerie())
+	for campo, valor in s.items():
+		if campo == 'baldes':
+			total['baldes'] = [a + b for a, b in zip(total['baldes'], valor)]
+		else:
+			total[campo] += valor
+
+def textoPrometheus():
+	series = {}
+	with _trava:
+		for (nome, chave), s in _series.items():
+			_somar(series, nome, chave, s)
+	# Os outros processos, pelo que eles gravaram por último; o deste vem da memória, sempre atualizado
+	if PASTA:
+		for arquivo in glob.glob(os.path.join(PASTA, '*.json')):
+			if arquivo == _arquivo():
+				continue
+			try:
+				with open(arquivo, encoding = 'utf-8') as f:
+					for nome, chave, s in json.load(f):
+						_somar(series, nome, chave, s)
+			except (OSError, ValueError):
+				continue
+
+	linhas = [
+		'# HELP cotb_callback_segundos Tempo total do callback: montagem da figura, preparo e serialização da resposta',
+		'# TYPE cotb_callback_segundos histogram',
+	]
+	for (nome, chave), s in sorted(series.items()):
+		acumulado = 0
+		for limite, n in zip(BALDES + ['+Inf'], s['baldes']):
+			acumulado += n
+			linhas.append('cotb_callback_segundos_bucket%s %d' % (_rotulos(nome, chave, ',le="%s"' % limite), acumulado))
+		linhas.append('cotb_callback_segundos_sum%s %.6f' % (_rotulos(nome, chave), s['segundos']))
+		linhas.append('cotb_callback_segundos_count%s %d' % (_rotulos(nome, chave), s['chamadas']))
+
+	contadores = [
+		('cotb_callback_construcao_segundos_total', 'construcao', 'Tempo dentro da função do callback (montagem da figura)'),
+		('cotb_callback_serializacao_segundos_total', 'serializacao', 'Tempo de preparo e serialização da resposta em JSON (só das respostas montadas, fora do cache)'),
+		('cotb_callback_resposta_bytes_total', 'bytes', 'Bytes de JSON devolvidos'),
+		('cotb_callback_cache_acertos_total', 'acertos', 'Figuras servidas do cache'),
+		('cotb_callback_cache_faltas_total', 'faltas', 'Figuras que não estavam no cache'),
+		('cotb_callback_erros_total', 'erros', 'Chamadas que terminaram em exceção'),
+	]
+	for metrica, campo, ajuda in contadores:
+		linhas.append('# HELP %s %s' % (metrica, ajuda))
+		linhas.append('# TYPE %s counter' % metrica)
+		for (nome, chave), s in sorted(series.items()):
+			valor = s[campo]
+			linhas.append('%s%s %s' % (metrica, _rotulos(nome, chave), ('%.6f' % valor) if isinstance(valor, float) else valor))
+	return '\n'.join(linhas) + '\n'
+
+def metricas():
+	return flask.Response(textoPrometheus(), mimetype = 'text/plain; version=0.0.4')
@@ -0,0 +1,25 @@
+# Criação dos apps Dash de cada visualização: sozinhos (python main.py, na pasta da visualização)
+# ou montados, cada um na sua rota, no servidor Flask compartilhado de servidor.py, na raiz.
+import dash
+from comum.metricas import instrumentar
+from comum import compressao, estilos, serializacao
+
+# Servidor Flask compartilhado; definido por servidor.py antes de importar as visualizações
+SERVIDOR = None
+# (rota, app) de cada visualização montada, na ordem de importação
+APPS = []
+
+def criarApp(nome, rota, **kwargs):
+	# Todos os callbacks de servidor passam pelas métricas de comum.metricas (/metrics),
+	# e todas as respostas pelo serializador de comum.serializacao
+	serializacao.instalar()
+	if SERVIDOR is None:
+		app = dash.Dash(nome, **kwargs)
+	else:
+		app = dash.Dash(nome, server = SERVIDOR, url_base_pathname = '/%s/' % rota, **kwargs)
+		APPS.append((rota, app))
+	# As folhas de estilo locais (comum.estilos) ficam em /estilos/ do servidor Flask,
+	# e o layout e os callbacks saem comprimidos e com ETag (comum.compressao)
+	estilos.registrar(app.server)
+	compressao.registrar(app.server)
+	return instrumentar(app, rota)
@@ -0,0 +1,107 @@
+# Serialização das respostas dos callbacks e do layout de todos os apps, no lugar do to_json do Dash.
+# O orjson escreve os arrays do numpy direto; o que ele não conhece sozinho (arrays de texto, Series,
+# componentes do Dash) passa por _converter só naquele ponto, em vez de o plotly refazer a limpeza da resposta
+# inteira em Python sempre que aparece um desses. Sem o orjson, o JSON sai pelo plotly, com os mesmos ajustes.
+#
+#   COTB_SERIALIZADOR=plotly    volta ao serializador do próprio Dash
+#   COTB_CASAS_DECIMAIS=n       arredonda os floats a n casas, em arrays, listas e valores soltos (padrão: sem arredondar)
+#   COTB_ARRAYS_BINARIOS=1      manda os arrays numéricos das figuras como arrays tipados em base64 do plotly.js
+#                               (plotly 6 ou mais novo); com os valores de poucas casas destes dados, as listas
+#                               saem menores e mais rápidas
+import datetime, decimal, os, sys
+import dash
+import numpy as np
+import pandas as pd
+import plotly.io
+
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+MOTOR = os.environ.get('COTB_SERIALIZADOR', 'orjson')
+CASAS = int(os.environ['COTB_CASAS_DECIMAIS']) if os.environ.get('COTB_CASAS_DECIMAIS') else None
+BINARIO = os.environ.get('COTB_ARRAYS_BINARIOS') == '1'
+
+# Funções internas do plotly, que só existem a partir do 6: importadas só quando são usadas
+if BINARIO:
+	from _plotly_utils.utils import is_skipped_key, to_typed_array_spec
+
+# Os mesmos escapes do plotly, para o JSON poder ir dentro do HTML da página
+ESCAPES = [('<', '\\u003c'), ('>', '\\u003e'), ('/', '\\u002f'), ('\u2028', '\\u2028'), ('\u2029', '\\u2029')]
+
+def _converter(obj):
+	# Chamado pelo orjson só para o que ele não serializa sozinho; o que sai daqui ainda pode voltar para cá
+	if hasattr(obj, 'to_plotly_json'):
+		return obj.to_plotly_json()
+	if isinstance(obj, np.ndarray):
+		if obj.dtype.kind in 'biuf':
+			return np.ascontiguousarray(obj)
+		if obj.dtype.kind == 'M':
+			return np.datetime_as_string(obj).tolist()
+		return obj.tolist()
+	if obj is pd.NaT or obj is pd.NA:
+		return None
+	if isinstance(obj, (pd.Series, pd.Index, pd.api.extensions.ExtensionArray)):
+		return obj.to_numpy()
+	if isinstance(obj, np.datetime64):
+		return str(obj)
+	if isinstance(obj, decimal.Decimal):
+		return float(obj)
+	if isinstance(obj, (datetime.date, datetime.time)):
+		return obj.isoformat()
+	raise TypeError('%s não é serializável em JSON' % type(obj).__name__)
+
+def _arranjo(v, binario):
+	if isinstance(v, (pd.Series, pd.Index)):
+		v = v.to_numpy()
+	if CASAS is not None and v.dtype.kind == 'f':
+		v = np.round(v, CASAS)
+	if binario and v.dtype.kind in 'biuf':
+		return to_typed_array_spec(v)
+	return v
+
+def _arredondar(v):
+	return round(v, CASAS) if CASAS is not None and isinstance(v, (float, np.floating)) else v
+
+def _preparar(obj, binario = False):
+	# Passa só pelos contêineres, sem mudar os originais; binario vale dentro do 'data' de uma figura.
+	# Listas só são percorridas quando começam por um contêiner; nas demais só os floats são arredondados
+	if isinstance(obj, dict):
+		figura = 'data' in obj and 'layout' in obj
+		return {
+			k: _preparar(v, binario or (figura and k == 'data')) if not (binario and BINARIO and is_skipped_key(k)) else v
+			for k, v in obj.items()
+		}
+	if isinstance(obj, (list, tuple)):
+		if obj and (isinstance(obj[0], (dict, list, tuple)) or hasattr(obj[0], 'to_plotly_json')):
+			return [_preparar(v, binario) for v in obj]
+		return [_arredondar(v) for v in obj] if CASAS is not None else obj
+	if isinstance(obj, (np.ndarray, pd.Series, pd.Index)):
+		return _arranjo(obj, binario and BINARIO)
+	if hasattr(obj, 'to_plotly_json'):
+		return _preparar(obj.to_plotly_json(), binario)
+	return _arredondar(obj)
+
+def serializar(valor):
+	if CASAS is not None or BINARIO:
+		valor = _preparar(valor)
+	if orjson is None:
+		return plotly.io.json.to_json_plotly(valor)
+	texto = orjson.dumps(valor, default = _converter, option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+	for inseguro, seguro in ESCAPES:
+		if inseguro in texto:
+			texto = texto.replace(inseguro, seguro)
+	return texto
+
+def instalar():
+	# O Dash importa o to_json pelo nome nos módulos que montam as respostas e o layout. Se uma versão nova
+	# deixar de fazer isso, trocar o nome não teria efeito nenhum: aí fica o serializador do próprio Dash, com aviso
+	if MOTOR == 'plotly':
+		return
+	modulos = [sys.modules.get('dash._callback'), sys.modules.get('dash.dash')]
+	if not all(hasattr(m, 'to_json') for m in modulos):
+		print('serializacao: o Dash %s não usa mais o to_json; respostas serializadas pelo próprio Dash' % dash.__version__)
+		return
+	for m in modulos:
+		m.to_json = serializar
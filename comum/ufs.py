@@ -0,0 +1,65 @@
+# Tabela de referência das UFs e regiões do Brasil, indexada pelo código do IBGE.
+# As buscas são vetoriais: um array indexado pelo próprio código, então mapear uma coluna inteira é uma só indexação.
+import numpy as np
+import pandas as pd
+
+# Na ordem do primeiro dígito do código da UF
+REGIOES = ['Norte', 'Nordeste', 'Sudeste', 'Sul', 'Centro-Oeste']
+
+# Nome de cada região em cada idioma; nos dados as regiões ficam sempre em português
+NOMES_REGIOES = {
+	'pt': { reg: reg for reg in REGIOES },
+	'en': {
+		'Norte': 'North',
+		'Nordeste': 'Northeast',
+		'Sudeste': 'Southeast',
+		'Sul': 'South',
+		'Centro-Oeste': 'Mid-West',
+	},
+}
+
+CORES_REGIOES = {
+	'Norte': '#636FFA',
+	'Nordeste': '#EF553B',
+	'Sudeste': '#00CC96',
+	'Sul': '#AB63FA',
+	'Centro-Oeste': '#FFA15A',
+}
+
+UFS = pd.DataFrame([
+	(11, 'RO', 'Rondônia'), (12, 'AC', 'Acre'), (13, 'AM', 'Amazonas'), (14, 'RR', 'Roraima'),
+	(15, 'PA', 'Pará'), (16, 'AP', 'Amapá'), (17, 'TO', 'Tocantins'),
+	(21, 'MA', 'Maranhão'), (22, 'PI', 'Piauí'), (23, 'CE', 'Ceará'), (24, 'RN', 'Rio Grande do Norte'),
+	(25, 'PB', 'Paraíba'), (26, 'PE', 'Pernambuco'), (27, 'AL', 'Alagoas'), (28, 'SE', 'Sergipe'), (29, 'BA', 'Bahia'),
+	(31, 'MG', 'Minas Gerais'), (32, 'ES', 'Espírito Santo'), (33, 'RJ', 'Rio de Janeiro'), (35, 'SP', 'São Paulo'),
+	(41, 'PR', 'Paraná'), (42, 'SC', 'Santa Catarina'), (43, 'RS', 'Rio Grande do Sul'),
+	(50, 'MS', 'Mato Grosso do Sul'), (51, 'MT', 'Mato Grosso'), (52, 'GO', 'Goiás'), (53, 'DF', 'Distrito Federal'),
+], columns = ['Código', 'Sigla', 'Nome']).set_index('Código')
+UFS['Região'] = pd.Categorical.from_codes(UFS.index // 10 - 1, REGIOES)
+
+def _porCodigo(valores):
+	# Posições que não são código de UF ficam vazias (None)
+	arr = np.full(UFS.index.max() + 1, None, dtype = object)
+	arr[UFS.index.values] = valores
+	return arr
+
+_SIGLAS = _porCodigo(UFS['Sigla'].values)
+_NOMES = _porCodigo(UFS['Nome'].values)
+_REGIOES = _porCodigo(UFS['Região'].astype(str).values)
+
+def _posicoes(codigos):
+	# Um código negativo contaria do fim do array, e um acima do maior daria IndexError: os dois são erro de dado
+	posicoes = np.asarray(codigos, dtype = int)
+	fora = posicoes[(posicoes < 0) | (posicoes >= len(_SIGLAS))]
+	if fora.size:
+		raise ValueError('códigos de UF fora de 0..%d: %s' % (len(_SIGLAS) - 1, sorted(set(fora.tolist()))))
+	return posicoes
+
+def sigla(codigos):
+	return _SIGLAS[_posicoes(codigos)]
+
+def nome(codigos):
+	return _NOMES[_posicoes(codigos)]
+
+def regiao(codigos):
+	return _REGIOES[_posicoes(codigos)]
@@ -0,0 +1,59 @@
+# Servidor de produção: as cinco visualizações num só processo, cada uma na sua rota, sem debug nem reloader.
+#
+#   gunicorn --preload -w 4 -b 0.0.0.0:8000 servidor:server
+#
+# Com --preload os dados são carregados uma única vez, no processo mestre, antes do fork;
+# os workers compartilham essas páginas de memória (copy-on-write) em vez de cada um ter a sua cópia.
+# O mesmo vale para as respostas dos callbacks, todas montadas no boot (comum/figuras.py).
+# Com vários workers, COTB_METRICAS_PASTA faz o /metrics somar os contadores de todos (comum/metricas.py).
+import gc, os, sys, importlib.util
+import flask
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, RAIZ)
+from comum import montagem, figuras, estilos
+
+# Sem o pacote de assets/ as páginas continuam com as folhas de codepen e pastebin; o servidor sobe, mas avisa
+if estilos.faltando():
+	print('estilos: %s fora do pacote, servidas dos endereços externos (rode python -m comum.estilos e faça commit de assets/)'
+		  % ', '.join(estilos.faltando()))
+
+# Pasta de cada visualização e o nome do módulo dela aqui dentro
+VISUALIZACOES = [
+	('Gestações', 'gestacoes'),
+	('Imunizações', 'imunizacoes'),
+	('Mortalidade x PIB x IDH', 'mortalidade'),
+	('Relação partos e mortalidade', 'partos'),
+	('Relação água e mortalidade', 'agua'),
+]
+
+server = flask.Flask(__name__)
+montagem.SERVIDOR = server
+
+for pasta, modulo in VISUALIZACOES:
+	spec = importlib.util.spec_from_file_location(modulo, os.path.join(RAIZ, pasta, 'main.py'))
+	sys.modules[modulo] = importlib.util.module_from_spec(spec)
+	spec.loader.exec_module(sys.modules[modulo])
+
+@server.route('/')
+def indice():
+	itens = ''.join('<li><a href="/%s/">%s</a></li>' % (rota, app.title) for rota, app in montagem.APPS)
+	return '<!DOCTYPE html><html><head><meta charset="utf-8"><title>Visualizações COTB</title></head>' \
+		   '<body style="font-family: sans-serif"><h2>Visualizações COTB</h2><ul>%s</ul></body></html>' % itens
+
+@server.route('/saude')
+def saude():
+	return flask.jsonify({
+		'status': 'ok',
+		'visualizacoes': [rota for rota, app in montagem.APPS],
+	})
+
+# O preparo faz requisições ao próprio servidor, então vem depois de todas as rotas
+figuras.prepararFiguras()
+
+# Tudo o que foi carregado até aqui vive até o fim do processo; tirar do coletor de lixo evita que ele
+# escreva nesses objetos nos workers e desfaça o compartilhamento das páginas
+gc.freeze()
+
+if __name__ == '__main__':
+	server.run(host = os.environ.get('HOST', '127.0.0.1'), port = int(os.environ.get('PORT', 8000)), debug = False)
@@ -0,0 +1,17 @@
+# Os testes sobem o mesmo servidor da produção (servidor.py, via benchmark.py), com o cache de figuras ligado
+# e montado num processo só; os que precisam da montagem de verdade esvaziam o cache (ver semCache).
+import os, sys
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+os.environ.pop('COTB_FIGURAS', None)
+os.environ.pop('COTB_FIGURAS_DISCO', None)
+os.environ['COTB_FIGURAS_PROCESSOS'] = '1'
+
+@pytest.fixture
+def semCache(monkeypatch):
+	# Cada chamada monta a resposta e nada fica guardado, como com COTB_FIGURAS=0
+	from comum import figuras
+	for cache in figuras._caches:
+		monkeypatch.setitem(cache, 'respostas', {})
+		monkeypatch.setitem(cache, 'chaves', set())
@@ -0,0 +1,55 @@
+# O cache de figuras (comum/figuras.py) montado no boot: as respostas guardadas são as mesmas que o callback
+# daria, os disparos separam as chaves e o que vem de fora do domínio é respondido sem ser guardado.
+import json
+import pytest
+import benchmark
+from comum import figuras
+from comum.figuras import corpoCallback, _chave, _corpos
+
+APPS = dict(benchmark.montagem.APPS)
+
+def _cache(rota):
+	return [c for c in figuras._caches if c['app'] is APPS[rota]][0]
+
+def _post(corpo, rota):
+	r = benchmark.cliente.post('/%s/_dash-update-component' % rota, json = corpo)
+	assert r.status_code == 200
+	return r.get_data(as_text = True)
+
+@pytest.mark.parametrize('rota', ['imunizacoes', 'mortalidade', 'agua'])
+def test_respostas_iguais(rota, monkeypatch):
+	cache = _cache(rota)
+	corpos = list(_corpos(cache))
+	assert set(cache['respostas']) == cache['chaves']
+
+	guardadas = [_post(corpo, rota) for corpo in corpos]
+	for corpo, resposta in zip(corpos, guardadas):
+		assert resposta == cache['respostas'][_chave(corpo['inputs'], corpo['state'], corpo['changedPropIds'], cache['disparos'])]
+
+	# As mesmas requisições com o cache vazio: cada resposta é montada de novo
+	monkeypatch.setitem(cache, 'respostas', {})
+	monkeypatch.setitem(cache, 'chaves', set())
+	for corpo, resposta in zip(corpos, guardadas):
+		assert _post(corpo, rota) == resposta
+
+def test_disparo_idioma():
+	app = APPS['imunizacoes']
+	valores = { 'slider-ano': 2005, 'eixos-fixos': ['x'], 'idioma': 'en', 'iniciado': True }
+	saida = '..graph.figure...iniciado.data..'
+	figura = json.loads(_post(corpoCallback(app, saida, valores, 'idioma.value'), 'imunizacoes'))['response']['graph']['figure']
+	patch = json.loads(_post(corpoCallback(app, saida, valores, 'slider-ano.value'), 'imunizacoes'))['response']['graph']['figure']
+	assert 'data' in figura and 'layout' in figura and '__dash_patch_update' not in figura
+	assert patch['__dash_patch_update'] == '__dash_patch_update'
+
+@pytest.mark.parametrize('rota, saida, valores, disparo', [
+	('agua', 'relacao-agua.figure', { 'dd-estado': 999, 'idioma': 'pt' }, 'dd-estado.value'),
+	('imunizacoes', '..graph.figure...iniciado.data..',
+	 { 'slider-ano': 2005, 'eixos-fixos': ['x', 'x'], 'idioma': 'pt', 'iniciado': True }, 'slider-ano.value'),
+])
+def test_fora_do_dominio(rota, saida, valores, disparo):
+	cache = _cache(rota)
+	antes = dict(cache['respostas'])
+	corpo = corpoCallback(APPS[rota], saida, valores, disparo)
+	_post(corpo, rota)
+	assert _chave(corpo['inputs'], corpo['state'], corpo['changedPropIds'], cache['disparos']) not in cache['respostas']
+	assert cache['respostas'] == antes
@@ -0,0 +1,56 @@
+# Todas as figuras de todos os domínios, validadas contra o esquema do plotly, e os Patches de Imunizações
+# conferidos contra a figura inteira que eles atualizam.
+#
+#   python -m pytest tests
+import itertools, json, sys
+import pytest
+import plotly.graph_objs as go
+import benchmark
+from comum import graficos
+from comum.figuras import corpoCallback
+from comum.idioma import IDIOMAS
+
+GRUPOS = benchmark.grupos()
+IMUNIZACOES = sys.modules['imunizacoes']
+SAIDA = '..graph.figure...iniciado.data..'
+
+@pytest.fixture(autouse = True)
+def validar(monkeypatch, semCache):
+	# Com o cache vazio (semCache), cada caso monta a figura de verdade, validada pelo plotly
+	monkeypatch.setattr(graficos, 'VALIDAR', True)
+	# Um erro de validação dentro do callback sobe como exceção, e não como um 500 sem detalhes
+	monkeypatch.setitem(benchmark.servidor.server.config, 'PROPAGATE_EXCEPTIONS', True)
+
+@pytest.mark.parametrize('grupo', list(GRUPOS))
+def test_figuras(grupo):
+	for caso in GRUPOS[grupo]:
+		assert caso() > 0
+
+def _aplicar(fig, operacoes):
+	# Aplica as atribuições de um Patch; tudo antes da última chave precisa já existir na figura
+	for op in operacoes:
+		assert op['operation'] == 'Assign'
+		*caminho, ultima = op['location']
+		alvo = fig
+		for chave in caminho:
+			if isinstance(alvo, list):
+				assert isinstance(chave, int) and chave < len(alvo), op['location']
+			else:
+				assert chave in alvo, op['location']
+			alvo = alvo[chave]
+		alvo[ultima] = op['params']['value']
+
+@pytest.mark.parametrize('idioma', IDIOMAS)
+def test_patch_imunizacoes(idioma):
+	app = dict(benchmark.montagem.APPS)['imunizacoes']
+	for ano, eixos, iniciado in itertools.product(IMUNIZACOES.ANOS, [[], ['x'], ['y'], ['x', 'y']], [False, True]):
+		valores = { 'slider-ano': ano, 'eixos-fixos': eixos, 'idioma': idioma, 'iniciado': iniciado }
+		r = benchmark.cliente.post('/imunizacoes/_dash-update-component', json = corpoCallback(app, SAIDA, valores, 'slider-ano.value'))
+		assert r.status_code == 200
+		patch = json.loads(r.data)['response']['graph']['figure']
+		assert patch['__dash_patch_update'] == '__dash_patch_update'
+
+		# Ida e volta pelo JSON, como a figura chega ao navegador
+		fig = json.loads(benchmark.serializar(IMUNIZACOES.montarFigura(ano, eixos, idioma)))
+		_aplicar(fig, patch['operations'])
+		go.Figure(fig)